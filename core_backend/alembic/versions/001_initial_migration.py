@@ -26,6 +26,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Create all tables with proper constraints and indexes."""
+    # Indexes are declared inline (Column index/unique flags or sa.Index) so each table and its
+    # indexes are created together in the migration transaction without separate create_index calls.
+
     # users
     op.create_table(
         'users',
@@ -33,8 +36,6 @@ def upgrade() -> None:
         sa.Column('email', sa.String(length=320), nullable=False, unique=True, index=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
     )
-    # Index for quicker lookup by email (unique already adds index in many DBs, but explicit for clarity)
-    op.create_index('ix_users_email', 'users', ['email'], unique=True)
 
     # connectors
     op.create_table(
@@ -45,7 +46,6 @@ def upgrade() -> None:
         sa.Column('config_schema', JSONType, nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
     )
-    op.create_index('ix_connectors_key', 'connectors', ['key'], unique=True)
 
     # connections
     op.create_table(
@@ -59,10 +59,10 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete="CASCADE"),
         sa.ForeignKeyConstraint(['connector_id'], ['connectors.id'], ondelete="CASCADE"),
         sa.UniqueConstraint('user_id', 'connector_id', name='uq_connection_per_user_connector'),
+        sa.Index('ix_connections_user_id', 'user_id'),
+        sa.Index('ix_connections_connector_id', 'connector_id'),
+        sa.Index('ix_connections_status', 'status'),
     )
-    op.create_index('ix_connections_user_id', 'connections', ['user_id'])
-    op.create_index('ix_connections_connector_id', 'connections', ['connector_id'])
-    op.create_index('ix_connections_status', 'connections', ['status'])
 
     # oauth_tokens
     op.create_table(
@@ -73,22 +73,14 @@ def upgrade() -> None:
         sa.Column('refresh_token', sa.String(length=2048), nullable=True),
         sa.Column('expires_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['connection_id'], ['connections.id'], ondelete="CASCADE"),
+        sa.Index('ix_oauth_tokens_connection_id', 'connection_id'),
     )
-    op.create_index('ix_oauth_tokens_connection_id', 'oauth_tokens', ['connection_id'])
 
 
 def downgrade() -> None:
     """Drop all tables (reverse order of dependencies)."""
-    op.drop_index('ix_oauth_tokens_connection_id', table_name='oauth_tokens')
+    # Inline indexes are dropped together with their tables
     op.drop_table('oauth_tokens')
-
-    op.drop_index('ix_connections_status', table_name='connections')
-    op.drop_index('ix_connections_connector_id', table_name='connections')
-    op.drop_index('ix_connections_user_id', table_name='connections')
     op.drop_table('connections')
-
-    op.drop_index('ix_connectors_key', table_name='connectors')
     op.drop_table('connectors')
-
-    op.drop_index('ix_users_email', table_name='users')
     op.drop_table('users')
@@ -0,0 +1,33 @@
+"""Make oauth_tokens.connection_id unique (one token per connection) for ON CONFLICT upserts.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Keep only the newest token per connection and enforce uniqueness on connection_id."""
+    op.execute(
+        "DELETE FROM oauth_tokens WHERE id NOT IN "
+        "(SELECT MAX(id) FROM oauth_tokens GROUP BY connection_id)"
+    )
+    # The unique index also serves connection_id lookups, replacing the plain index
+    op.drop_index('ix_oauth_tokens_connection_id', table_name='oauth_tokens')
+    op.create_index('uq_oauth_tokens_connection_id', 'oauth_tokens', ['connection_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Restore the non-unique connection_id index."""
+    op.drop_index('uq_oauth_tokens_connection_id', table_name='oauth_tokens')
+    op.create_index('ix_oauth_tokens_connection_id', 'oauth_tokens', ['connection_id'])
@@ -0,0 +1,45 @@
+"""Store users.email as CITEXT on PostgreSQL for case-insensitive, index-backed lookups.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import CITEXT
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enable citext and convert users.email to it (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    # The unique ix_users_email index is rebuilt with the column, so it becomes case-insensitive;
+    # the conversion fails if existing emails differ only by case
+    op.alter_column(
+        'users', 'email',
+        type_=CITEXT(),
+        existing_type=sa.String(length=320),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Convert users.email back to VARCHAR(320); the citext extension is left installed."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'users', 'email',
+        type_=sa.String(length=320),
+        existing_type=CITEXT(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,32 @@
+"""Store emails lower-cased and index lower(email) where CITEXT is unavailable.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Lower-case stored emails and add a unique functional index on lower(email)."""
+    # Rows are written lower-cased from now on; existing ones are normalized to match
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    # PostgreSQL stores email as CITEXT, whose unique index already matches case-insensitively
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the lower(email) index (emails stay lower-cased)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_users_email_lower', table_name='users')
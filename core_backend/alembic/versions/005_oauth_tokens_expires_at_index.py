@@ -0,0 +1,31 @@
+"""Index oauth_tokens.expires_at for scans of tokens nearing expiry.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create a partial index on expires_at covering only tokens that expire."""
+    op.create_index(
+        'ix_oauth_tokens_expires_at', 'oauth_tokens', ['expires_at'],
+        postgresql_where=sa.text("expires_at IS NOT NULL"),
+        sqlite_where=sa.text("expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the expires_at index."""
+    op.drop_index('ix_oauth_tokens_expires_at', table_name='oauth_tokens')
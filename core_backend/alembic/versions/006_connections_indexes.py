@@ -0,0 +1,54 @@
+"""Rework connection indexes: drop redundant ones, add a partial active index and JSONB GIN indexes.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the user_id and status indexes and add GIN indexes on the JSONB columns."""
+    # uq_connection_per_user_connector leads with user_id and already serves user_id lookups
+    op.drop_index('ix_connections_user_id', table_name='connections')
+    op.drop_index('ix_connections_status', table_name='connections')
+    # Partial index for the hot "active connections per user" filter; skips inactive/error rows
+    op.create_index(
+        'ix_connections_status_active', 'connections', ['user_id'],
+        postgresql_where=sa.text("status = 'active'"),
+        sqlite_where=sa.text("status = 'active'"),
+    )
+
+    # GIN indexes for JSONB containment (@>) filters; jsonb_path_ops is smaller and faster than jsonb_ops
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_connectors_config_schema_gin', 'connectors', ['config_schema'],
+            postgresql_using='gin',
+            postgresql_ops={'config_schema': 'jsonb_path_ops'},
+        )
+        op.create_index(
+            'ix_connections_config_data_gin', 'connections', ['config_data'],
+            postgresql_using='gin',
+            postgresql_ops={'config_data': 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain user_id and status indexes."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_connections_config_data_gin', table_name='connections')
+        op.drop_index('ix_connectors_config_schema_gin', table_name='connectors')
+
+    op.drop_index('ix_connections_status_active', table_name='connections')
+    op.create_index('ix_connections_status', 'connections', ['status'])
+    op.create_index('ix_connections_user_id', 'connections', ['user_id'])
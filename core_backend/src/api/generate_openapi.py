@@ -1,6 +1,7 @@
-import json
 import os
 
+import orjson
+
 from src.api.main import app
 
 """
@@ -11,12 +12,13 @@ This script can be invoked with:
 """
 
 def main():
+    # app.openapi() walks every route; build the schema once and reuse it for the dump
     openapi_schema = app.openapi()
     output_dir = "interfaces"
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, "openapi.json")
-    with open(output_path, "w") as f:
-        json.dump(openapi_schema, f, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
     print(f"OpenAPI schema written to {output_path}")
 
 
@@ -1,13 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.api.routes import connectors, connections, oauth
 from src.config import settings
+from src.database.connection import engine, ping, pool_status
+from src.services.plugin_manager import get_plugin_manager
+from src.services.token_refresh_scheduler import run_token_refresh_scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: run the token refresh scheduler and, on shutdown, stop it
+    and release pooled database connections.
+    """
+    scheduler = None
+    # Without a plugin that implements refresh_tokens, every scan would find nothing to refresh
+    refreshable = any(plugin.supports_token_refresh for plugin in get_plugin_manager().get_all_plugins())
+    if settings.token_refresh_interval > 0 and refreshable:
+        scheduler = asyncio.create_task(run_token_refresh_scheduler(settings.token_refresh_interval))
+    yield
+    if scheduler is not None:
+        scheduler.cancel()
+        with suppress(asyncio.CancelledError):
+            await scheduler
+    engine.dispose()
+
 
 # FastAPI app configuration with OpenAPI metadata
 app = FastAPI(
     title="Connector Framework Manager API",
     description="API for managing connectors, connections, and OAuth flows for third-party service integrations",
     version="1.0.0",
+    lifespan=lifespan,
+    # Serialize responses with orjson (C encoder) instead of the stdlib json module
+    default_response_class=ORJSONResponse,
+    # OpenAPI/docs are opt-out so production containers never build the schema;
+    # src.api.generate_openapi still builds it explicitly via app.openapi()
+    openapi_url="/openapi.json" if settings.enable_openapi else None,
+    docs_url="/docs" if settings.enable_openapi else None,
+    redoc_url="/redoc" if settings.enable_openapi else None,
     openapi_tags=[
         {
             "name": "connectors",
@@ -28,14 +63,18 @@ app = FastAPI(
     ]
 )
 
-# CORS middleware configuration - use settings and avoid wildcards
-allowed_origins = list({settings.frontend_base_url, settings.backend_base_url})
+# CORS middleware configuration - use settings and avoid wildcards.
+# Computed once at import; origins are deduplicated while keeping a stable order.
+CORS_ALLOWED_ORIGINS = tuple(dict.fromkeys(filter(None, (settings.frontend_base_url, settings.backend_base_url))))
+CORS_ALLOWED_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_ALLOWED_HEADERS = ("Authorization", "Content-Type", "Accept")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "Accept"],
+    allow_methods=CORS_ALLOWED_METHODS,
+    allow_headers=CORS_ALLOWED_HEADERS,
 )
 
 # Include API routers under /api prefix
@@ -56,28 +95,43 @@ def health_check():
     return {"message": "Healthy", "service": "Connector Framework Manager API"}
 
 
-# PUBLIC_INTERFACE
-@app.get("/healthz", tags=["health"])
-def liveness_probe():
-    """
-    Liveness probe endpoint for container orchestration.
+if settings.enable_probes:
+    # PUBLIC_INTERFACE
+    @app.get("/healthz", tags=["health"])
+    def liveness_probe():
+        """
+        Liveness probe endpoint for container orchestration.
 
-    Returns:
-        Dict: Liveness status
-    """
-    return {"status": "ok"}
+        Returns:
+            Dict: Liveness status
+        """
+        return {"status": "ok"}
 
+    # PUBLIC_INTERFACE
+    @app.get("/readyz", tags=["health"])
+    def readiness_probe():
+        """
+        Readiness probe endpoint for container orchestration.
 
-# PUBLIC_INTERFACE
-@app.get("/readyz", tags=["health"])
-def readiness_probe():
-    """
-    Readiness probe endpoint for container orchestration.
+        Returns:
+            Dict: Readiness status; 503 when the database does not respond
+        """
+        if not ping():
+            return ORJSONResponse(status_code=503, content={"status": "unavailable"})
+        return {"status": "ready"}
 
-    Returns:
-        Dict: Readiness status
-    """
-    return {"status": "ready"}
+
+if settings.enable_metrics:
+    # PUBLIC_INTERFACE
+    @app.get("/metrics", tags=["health"])
+    def metrics():
+        """
+        Database connection pool metrics for detecting pool saturation.
+
+        Returns:
+            Dict: Pool usage counters
+        """
+        return {"db_pool": pool_status()}
 
 
 # PUBLIC_INTERFACE
@@ -1,13 +1,22 @@
 """Connections API routes for managing user connections to connectors."""
+import asyncio
+import orjson
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import exists, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from src.database.connection import get_db
-from src.models.user import User
+from src.database.connection import get_db, loader_options, upsert_insert
+from src.models.user import User, normalize_email
 from src.models.connector import Connector
 from src.models.connection import Connection
-from src.services.plugin_manager import plugin_manager
+from src.plugins.base import ConnectorPlugin
+from src.services.plugin_manager import get_plugin_manager
+from src.services.oauth_token_repository import oauth_token_repo
+from src.services.response_cache import CONNECTORS_LIST_KEY, response_cache
+from src.services.token_cache import token_cache
 from src.auth.jwt import get_current_user_optional
 from src.api.schemas import (
     ConnectionCreate, 
@@ -16,9 +25,11 @@ from src.api.schemas import (
     ConnectorResponse
 )
 
+# Handlers that only perform blocking (sync) database work are declared with plain `def`
+# so FastAPI runs them in its threadpool instead of blocking the event loop; the async
+# connection test hands its database work to worker threads with asyncio.to_thread.
 router = APIRouter(prefix="/connections", tags=["connections"])
 
-
 def get_current_user(authorization: Optional[str] = Header(None)) -> Optional[Dict[str, Any]]:
     """Extract current user from authorization header."""
     return get_current_user_optional(authorization)
@@ -34,9 +45,42 @@ def require_user(current_user: Optional[Dict[str, Any]] = Depends(get_current_us
     return current_user
 
 
+def _connection_response(
+    connection: Connection,
+    connector: Connector,
+    plugin: Optional[ConnectorPlugin],
+    has_oauth_token: bool
+) -> ConnectionResponse:
+    """
+    Build a connection response with its nested connector details.
+
+    Uses model_construct since every value comes from the database or plugin registry;
+    FastAPI still validates the result against the route's response_model.
+    """
+    supports_oauth, oauth_scopes = plugin.oauth_capabilities if plugin else (False, ())
+    return ConnectionResponse.model_construct(
+        id=connection.id,
+        user_id=connection.user_id,
+        connector_id=connection.connector_id,
+        connector=ConnectorResponse.model_construct(
+            id=connector.id,
+            key=connector.key,
+            name=connector.name,
+            config_schema=connector.config_schema,
+            supports_oauth=supports_oauth,
+            oauth_scopes=list(oauth_scopes),
+            created_at=connector.created_at
+        ),
+        config_data=connection.config_data,
+        status=connection.status,
+        created_at=connection.created_at,
+        has_oauth_token=has_oauth_token
+    )
+
+
 # PUBLIC_INTERFACE
 @router.get("/", response_model=List[ConnectionResponse])
-async def list_connections(
+def list_connections(
     current_user: Dict[str, Any] = Depends(require_user),
     db: Session = Depends(get_db)
 ):
@@ -48,44 +92,28 @@ async def list_connections(
     """
     user_id = current_user["user_id"]
     
+    # selectinload fetches all connectors in one batched IN query (not a JOIN that repeats
+    # connector columns on every connection row), independent of the number of connections
     connections = db.query(Connection).options(
-        joinedload(Connection.connector),
-        joinedload(Connection.oauth_tokens)
+        *loader_options(selectinload(Connection.connector))
     ).filter(Connection.user_id == user_id).all()
     
-    result = []
-    for connection in connections:
-        # Get plugin info for OAuth capabilities
-        plugin = plugin_manager.get_plugin(connection.connector.key)
-        
-        # Check if connection has OAuth tokens
-        has_oauth_token = len(connection.oauth_tokens) > 0
-        
-        result.append(ConnectionResponse(
-            id=connection.id,
-            user_id=connection.user_id,
-            connector_id=connection.connector_id,
-            connector=ConnectorResponse(
-                id=connection.connector.id,
-                key=connection.connector.key,
-                name=connection.connector.name,
-                config_schema=connection.connector.config_schema,
-                supports_oauth=(plugin.metadata.supports_oauth if plugin else False),
-                oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-                created_at=connection.connector.created_at
-            ),
-            config_data=connection.config_data,
-            status=connection.status,
-            created_at=connection.created_at,
-            has_oauth_token=has_oauth_token
-        ))
-    
-    return result
+    # Resolve plugin info for OAuth capabilities once per distinct connector
+    plugins = get_plugin_manager().get_plugins_bulk({c.connector.key for c in connections})
+    
+    # Rows are DB-trusted, so the dumped dicts go straight to orjson, skipping FastAPI's
+    # response_model re-validation and jsonable_encoder passes on this list endpoint
+    return ORJSONResponse(content=[
+        _connection_response(
+            connection, connection.connector, plugins[connection.connector.key], connection.has_oauth_token
+        ).model_dump()
+        for connection in connections
+    ])
 
 
 # PUBLIC_INTERFACE
 @router.get("/{connection_id}", response_model=ConnectionResponse)
-async def get_connection(
+def get_connection(
     connection_id: int,
     current_user: Dict[str, Any] = Depends(require_user),
     db: Session = Depends(get_db)
@@ -99,15 +127,7 @@ async def get_connection(
     Returns:
         Connection details
     """
-    user_id = current_user["user_id"]
-    
-    connection = db.query(Connection).options(
-        joinedload(Connection.connector),
-        joinedload(Connection.oauth_tokens)
-    ).filter(
-        Connection.id == connection_id,
-        Connection.user_id == user_id
-    ).first()
+    connection = _get_owned_connection(db, connection_id, current_user["user_id"])
     
     if not connection:
         raise HTTPException(
@@ -115,33 +135,14 @@ async def get_connection(
             detail="Connection not found"
         )
     
-    # Get plugin info
-    plugin = plugin_manager.get_plugin(connection.connector.key)
-    has_oauth_token = len(connection.oauth_tokens) > 0
-    
-    return ConnectionResponse(
-        id=connection.id,
-        user_id=connection.user_id,
-        connector_id=connection.connector_id,
-        connector=ConnectorResponse(
-            id=connection.connector.id,
-            key=connection.connector.key,
-            name=connection.connector.name,
-            config_schema=connection.connector.config_schema,
-            supports_oauth=(plugin.metadata.supports_oauth if plugin else False),
-            oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-            created_at=connection.connector.created_at
-        ),
-        config_data=connection.config_data,
-        status=connection.status,
-        created_at=connection.created_at,
-        has_oauth_token=has_oauth_token
+    return _connection_response(
+        connection, connection.connector, get_plugin_manager().get_plugin(connection.connector.key), connection.has_oauth_token
     )
 
 
 # PUBLIC_INTERFACE
 @router.post("/", response_model=ConnectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_connection(
+def create_connection(
     connection_data: ConnectionCreate,
     current_user: Dict[str, Any] = Depends(require_user),
     db: Session = Depends(get_db)
@@ -157,55 +158,59 @@ async def create_connection(
     """
     user_id = current_user["user_id"]
     
-    # Ensure user exists in database
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        # Create user if not exists
-        user = User(id=user_id, email=current_user["email"])
-        db.add(user)
-        db.commit()
-    
-    # Get or create connector
-    connector = db.query(Connector).filter(Connector.key == connection_data.connector_key).first()
-    if not connector:
+    # Ensure user exists in database (idempotent, part of this request's transaction)
+    db.execute(
+        upsert_insert(db, User)
+        .values(id=user_id, email=normalize_email(current_user["email"]))
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    
+    # Get connector together with a flag telling whether the user already has a connection to it
+    has_connection = exists().where(
+        Connection.user_id == user_id,
+        Connection.connector_id == Connector.id
+    ).label("has_connection")
+    row = db.execute(
+        select(Connector, has_connection).where(Connector.key == connection_data.connector_key)
+    ).first()
+    if row:
+        connector, already_connected = row
+    else:
         # Check if plugin exists
-        plugin = plugin_manager.get_plugin(connection_data.connector_key)
+        plugin = get_plugin_manager().get_plugin(connection_data.connector_key)
         if not plugin:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Connector '{connection_data.connector_key}' not found"
             )
         
-        # Create connector from plugin
-        connector = Connector(
-            key=plugin.metadata.key,
-            name=plugin.metadata.name,
-            config_schema=plugin.get_config_schema()
+        # Create connector from plugin; a concurrent request may have inserted it already
+        db.execute(
+            upsert_insert(db, Connector)
+            .values(
+                key=plugin.metadata.key,
+                name=plugin.metadata.name,
+                config_schema=plugin.config_schema
+            )
+            .on_conflict_do_nothing(index_elements=["key"])
         )
-        db.add(connector)
-        db.commit()
-        db.refresh(connector)
-    
-    # Validate configuration against schema if provided
-    if connection_data.config_data and connector.config_schema:
-        # Basic validation - in production, use jsonschema library
-        required_fields = connector.config_schema.get("required", [])
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in connection_data.config_data:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required field: {field}"
-                )
+        connector = db.query(Connector).filter(Connector.key == plugin.metadata.key).one()
+        already_connected = False
+    connector_created = row is None
+    
+    # Validate configuration against schema if provided (basic check - in production, use jsonschema library);
+    # skipped entirely when the connector declares no required fields
+    if connection_data.config_data and (required_fields := connector.required_config_fields):
+        # Report every missing required field at once
+        missing = [field for field in required_fields if field not in connection_data.config_data]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing required fields: {', '.join(missing)}"
+            )
     
     # Check if connection already exists
-    existing = db.query(Connection).filter(
-        Connection.user_id == user_id,
-        Connection.connector_id == connector.id
-    ).first()
-    
-    if existing:
+    if already_connected:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Connection already exists for this connector"
@@ -220,42 +225,31 @@ async def create_connection(
     )
     
     db.add(connection)
-    db.commit()
-    db.refresh(connection)
-    
-    # Load relationships
-    db.refresh(connection)
-    connection = db.query(Connection).options(
-        joinedload(Connection.connector),
-        joinedload(Connection.oauth_tokens)
-    ).filter(Connection.id == connection.id).first()
+    # Flush to obtain the generated id; the response is built from in-memory state
+    # before commit so no post-commit reload of the connection or connector is needed
+    try:
+        db.flush()
+    except IntegrityError:
+        # uq_connection_per_user_connector caught a concurrent duplicate
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Connection already exists for this connector"
+        )
     
-    # Get plugin info
-    plugin = plugin_manager.get_plugin(connector.key)
+    # A freshly created connection has no tokens yet
+    response = _connection_response(connection, connector, get_plugin_manager().get_plugin(connector.key), False)
+    db.commit()
+    if connector_created:
+        # The connector row now replaces its plugin-only entry in GET /connectors/
+        response_cache.invalidate(CONNECTORS_LIST_KEY)
     
-    return ConnectionResponse(
-        id=connection.id,
-        user_id=connection.user_id,
-        connector_id=connection.connector_id,
-        connector=ConnectorResponse(
-            id=connection.connector.id,
-            key=connection.connector.key,
-            name=connection.connector.name,
-            config_schema=connection.connector.config_schema,
-            supports_oauth=(plugin.metadata.supports_oauth if plugin else False),
-            oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-            created_at=connection.connector.created_at
-        ),
-        config_data=connection.config_data,
-        status=connection.status,
-        created_at=connection.created_at,
-        has_oauth_token=False
-    )
+    return response
 
 
 # PUBLIC_INTERFACE
 @router.put("/{connection_id}", response_model=ConnectionResponse)
-async def update_connection(
+def update_connection(
     connection_id: int,
     connection_data: ConnectionUpdate,
     current_user: Dict[str, Any] = Depends(require_user),
@@ -271,14 +265,7 @@ async def update_connection(
     Returns:
         Updated connection details
     """
-    user_id = current_user["user_id"]
-    
-    connection = db.query(Connection).options(
-        joinedload(Connection.connector)
-    ).filter(
-        Connection.id == connection_id,
-        Connection.user_id == user_id
-    ).first()
+    connection = _get_owned_connection(db, connection_id, current_user["user_id"])
     
     if not connection:
         raise HTTPException(
@@ -288,59 +275,34 @@ async def update_connection(
     
     # Update fields
     if connection_data.config_data is not None:
-        # Validate against schema if provided
-        if connection.connector.config_schema:
-            required_fields = connection.connector.config_schema.get("required", [])
-            
-            # Check required fields
-            for field in required_fields:
-                if field not in connection_data.config_data:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Missing required field: {field}"
-                    )
+        # Validate against schema if provided; skipped when nothing is required
+        if required_fields := connection.connector.required_config_fields:
+            # Report every missing required field at once
+            missing = [field for field in required_fields if field not in connection_data.config_data]
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Missing required fields: {', '.join(missing)}"
+                )
         
         connection.config_data = connection_data.config_data
     
     if connection_data.status is not None:
         connection.status = connection_data.status
     
+    # Relationships were loaded by the initial query; build the response before
+    # commit expires them so no second SELECT is needed
+    response = _connection_response(
+        connection, connection.connector, get_plugin_manager().get_plugin(connection.connector.key), connection.has_oauth_token
+    )
     db.commit()
-    db.refresh(connection)
-    
-    # Load relationships for response
-    connection = db.query(Connection).options(
-        joinedload(Connection.connector),
-        joinedload(Connection.oauth_tokens)
-    ).filter(Connection.id == connection.id).first()
     
-    # Get plugin info
-    plugin = plugin_manager.get_plugin(connection.connector.key)
-    has_oauth_token = len(connection.oauth_tokens) > 0
-    
-    return ConnectionResponse(
-        id=connection.id,
-        user_id=connection.user_id,
-        connector_id=connection.connector_id,
-        connector=ConnectorResponse(
-            id=connection.connector.id,
-            key=connection.connector.key,
-            name=connection.connector.name,
-            config_schema=connection.connector.config_schema,
-            supports_oauth=plugin is not None,
-            oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-            created_at=connection.connector.created_at
-        ),
-        config_data=connection.config_data,
-        status=connection.status,
-        created_at=connection.created_at,
-        has_oauth_token=has_oauth_token
-    )
+    return response
 
 
 # PUBLIC_INTERFACE
 @router.delete("/{connection_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_connection(
+def delete_connection(
     connection_id: int,
     current_user: Dict[str, Any] = Depends(require_user),
     db: Session = Depends(get_db)
@@ -366,6 +328,7 @@ async def delete_connection(
     
     db.delete(connection)
     db.commit()
+    token_cache.invalidate(connection_id)
 
 
 # PUBLIC_INTERFACE
@@ -384,15 +347,7 @@ async def test_connection(
     Returns:
         Test result with success status and sample data
     """
-    user_id = current_user["user_id"]
-    
-    connection = db.query(Connection).options(
-        joinedload(Connection.connector),
-        joinedload(Connection.oauth_tokens)
-    ).filter(
-        Connection.id == connection_id,
-        Connection.user_id == user_id
-    ).first()
+    connection = await asyncio.to_thread(_get_owned_connection, db, connection_id, current_user["user_id"])
     
     if not connection:
         raise HTTPException(
@@ -401,44 +356,37 @@ async def test_connection(
         )
     
     # Get plugin
-    plugin = plugin_manager.get_plugin(connection.connector.key)
+    plugin = get_plugin_manager().get_plugin(connection.connector.key)
     if not plugin:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Plugin not available for this connector"
         )
     
+    # Outcome status is written once at the end, whatever path the test takes
+    new_status = "error"
     try:
-        # Prepare token data if available
-        token_data = None
-        if connection.oauth_tokens:
-            token = connection.oauth_tokens[0]  # Get latest token
-            token_data = {
-                "access_token": token.access_token,
-                "refresh_token": token.refresh_token,
-                "expires_at": token.expires_at
-            }
+        # Token data from the plugin manager's token cache: read from the database (in a worker
+        # thread) on a miss, refreshed in the background when close to expiry and before use once expired
+        token_data = await get_plugin_manager().get_tokens(
+            connection.connector.key, connection_id, lambda: oauth_token_repo.token_data(db, connection_id)
+        )
         
         # Test the connection
         is_connected = await plugin.test_connection(connection.config_data or {}, token_data)
         
         if is_connected:
-            # Update connection status
-            connection.status = "active"
-            db.commit()
+            new_status = "active"
             
-            # Fetch sample data
-            sample_data = await plugin.fetch_sample(connection.config_data or {}, token_data)
+            # Fetch sample data as encoded JSON; a Fragment embeds it without re-serialization
+            sample_json = await plugin.fetch_sample_bytes(connection.config_data or {}, token_data)
             
-            return {
+            return ORJSONResponse({
                 "success": True,
                 "message": "Connection test successful",
-                "sample_data": sample_data
-            }
+                "sample_data": orjson.Fragment(sample_json)
+            })
         else:
-            connection.status = "error"
-            db.commit()
-            
             return {
                 "success": False,
                 "message": "Connection test failed",
@@ -446,11 +394,33 @@ async def test_connection(
             }
     
     except Exception as e:
-        connection.status = "error"
-        db.commit()
+        new_status = "error"
         
         return {
             "success": False,
             "message": f"Connection test failed: {str(e)}",
             "sample_data": None
         }
+    
+    finally:
+        # Single UPDATE + commit, skipped entirely when the status did not change
+        if connection.status != new_status:
+            await asyncio.to_thread(_set_connection_status, db, connection_id, new_status)
+
+
+def _get_owned_connection(db: Session, connection_id: int, user_id: int) -> Optional[Connection]:
+    """Load a user's connection with its connector (blocking; run in a worker thread)."""
+    return db.query(Connection).options(
+        *loader_options(joinedload(Connection.connector))
+    ).filter(
+        Connection.id == connection_id,
+        Connection.user_id == user_id
+    ).first()
+
+
+def _set_connection_status(db: Session, connection_id: int, new_status: str) -> None:
+    """Store a connection's status and commit (blocking; run in a worker thread)."""
+    db.execute(
+        update(Connection).where(Connection.id == connection_id).values(status=new_status)
+    )
+    db.commit()
@@ -1,68 +1,184 @@
 """Connectors API routes for managing connector definitions and plugins."""
+import hashlib
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, Iterator, List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import exists, select, update
 from sqlalchemy.orm import Session
 
-from src.database.connection import get_db
+from src.database.connection import db_session, get_db, loader_options
+from src.models.connection import Connection
 from src.models.connector import Connector
-from src.services.plugin_manager import plugin_manager
-from src.api.schemas import ConnectorResponse
+from src.plugins.base import ConnectorPlugin
+from src.services.plugin_manager import get_plugin_manager
+from src.services.response_cache import CONNECTORS_LIST_KEY, response_cache
+from src.services.token_cache import token_cache
+from src.api.schemas import ConnectorCreate, ConnectorResponse, ConnectorUpdate
 
-router = APIRouter(prefix="/connectors", tags=["connectors"])
+# Handlers only perform blocking (sync) database work, so they are declared with plain `def`
+# and FastAPI runs them in its threadpool instead of blocking the event loop.
+# Responses serialize with orjson even when the router is mounted on an app with a different default.
+router = APIRouter(prefix="/connectors", tags=["connectors"], default_response_class=ORJSONResponse)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Stored connectors fetched per round trip when streaming the listing
+STREAM_BATCH_SIZE = 200
+# Connector reads are per-client cacheable briefly and revalidated with If-None-Match
+CACHE_CONTROL = "private, max-age=60"
+# The listing is JSON or NDJSON depending on Accept, so caches must key on it
+LIST_VARY = {"Vary": "Accept"}
+# created_at reported for plugins whose connector is not stored yet. A fixed constant (the Unix
+# epoch), so their response bodies and ETags are identical across requests, workers and restarts
+PLUGIN_CONNECTORS_CREATED_AT = datetime(1970, 1, 1)
 
 
 # PUBLIC_INTERFACE
 @router.get("/", response_model=List[ConnectorResponse])
-async def list_connectors(db: Session = Depends(get_db)):
+def list_connectors(
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """
     List all available connectors from plugins and database.
     
     Returns a combined list of connectors from the plugin system
-    and any additional connectors stored in the database.
+    and any additional connectors stored in the database. The listing changes
+    only when connectors are written, so it is served from the response cache.
+    
+    Clients sending `Accept: application/x-ndjson` get one JSON object per line,
+    streamed as database rows arrive instead of materializing the whole list.
+    
+    The response carries an ETag; a matching If-None-Match gets an empty 304.
     """
-    # Get all available plugins
-    plugins = plugin_manager.get_all_plugins()
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(_stream_connector_lines(), media_type=NDJSON_MEDIA_TYPE, headers=LIST_VARY)
+    
+    # Rows are built from trusted DB/plugin data, so the body is serialized once per cache
+    # entry and returned directly, skipping FastAPI's response_model re-validation pass
+    body, etag = response_cache.get_or_set(
+        CONNECTORS_LIST_KEY,
+        lambda: _with_etag(orjson.dumps([response.model_dump() for response in _build_connector_list(db)]))
+    )
+    return _conditional_json_response(body, etag, if_none_match, LIST_VARY)
+
+
+def _with_etag(body: bytes) -> Tuple[bytes, str]:
+    """Pair a JSON body with its strong ETag (BLAKE2b digest of the body)."""
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _conditional_json_response(
+    body: bytes,
+    etag: str,
+    if_none_match: Optional[str],
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Return body as JSON with ETag/Cache-Control headers, or an empty 304 if the client has it.
+
+    Args:
+        body: Serialized JSON body
+        etag: Strong ETag of body
+        if_none_match: Raw If-None-Match request header
+        extra_headers: Further headers for both the 200 and the 304 (e.g. Vary)
+
+    Returns:
+        Response: 200 with body, or 304 without body
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if extra_headers:
+        headers.update(extra_headers)
+    if if_none_match:
+        # If-None-Match uses weak comparison, so W/-prefixed tags match too
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _build_connector_list(db: Session) -> List[ConnectorResponse]:
+    """Combine stored connectors with plugins that are not stored yet."""
+    # Snapshot all available plugins once, keyed by connector key; stored connectors claim
+    # their plugin while being converted so whatever is left afterwards is not stored yet
+    unstored_plugins = {plugin.metadata.key: plugin for plugin in get_plugin_manager().get_all_plugins()}
     
     # Get stored connectors from database
-    stored_connectors = db.query(Connector).all()
-    stored_keys = {conn.key for conn in stored_connectors}
-    
-    result = []
-    
-    # Add stored connectors first
-    for connector in stored_connectors:
-        plugin = plugin_manager.get_plugin(connector.key)
-        result.append(ConnectorResponse(
-            id=connector.id,
-            key=connector.key,
-            name=connector.name,
-            config_schema=connector.config_schema,
-            supports_oauth=(plugin.metadata.supports_oauth if plugin else False),
-            oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-            created_at=connector.created_at
-        ))
-    
-    # Add plugins that aren't in database yet
-    for plugin in plugins:
-        if plugin.metadata.key not in stored_keys:
-            # Create a temporary connector response for plugins not yet stored
-            result.append(ConnectorResponse(
-                id=0,  # Temporary ID for plugins not in DB
-                key=plugin.metadata.key,
-                name=plugin.metadata.name,
-                config_schema=plugin.get_config_schema(),
-                supports_oauth=plugin.metadata.supports_oauth,
-                oauth_scopes=plugin.metadata.oauth_scopes,
-                created_at=datetime.utcnow()
-            ))
+    stored_connectors = db.execute(select(Connector).options(*loader_options())).scalars().all()
     
+    # Stored connectors first, then plugins that aren't in database yet
+    result = [
+        _stored_connector_response(connector, unstored_plugins.pop(connector.key, None))
+        for connector in stored_connectors
+    ]
+    result.extend([_plugin_connector_response(plugin) for plugin in unstored_plugins.values()])
     return result
 
 
+def _stream_connector_lines() -> Iterator[bytes]:
+    """Yield the connector listing as NDJSON lines, fetching stored rows in batches."""
+    unstored_plugins = {plugin.metadata.key: plugin for plugin in get_plugin_manager().get_all_plugins()}
+    
+    # The request-scoped session is closed before a streaming body is sent, so the
+    # generator owns its own session for the lifetime of the stream
+    with db_session() as db:
+        stored_connectors = db.execute(
+            select(Connector).options(*loader_options()).execution_options(yield_per=STREAM_BATCH_SIZE)
+        ).scalars()
+        for connector in stored_connectors:
+            response = _stored_connector_response(connector, unstored_plugins.pop(connector.key, None))
+            yield orjson.dumps(response.model_dump()) + b"\n"
+    
+    for plugin in unstored_plugins.values():
+        yield orjson.dumps(_plugin_connector_response(plugin).model_dump()) + b"\n"
+
+
+def _stored_connector_response(connector: Connector, plugin: Optional[ConnectorPlugin]) -> ConnectorResponse:
+    """
+    Build the response for a stored connector, enriched with its plugin's OAuth capabilities.
+
+    Uses model_construct since the data comes from the database and plugin registry; routes
+    that return a single model still get it validated by FastAPI against response_model.
+    """
+    supports_oauth, oauth_scopes = plugin.oauth_capabilities if plugin else (False, ())
+    return ConnectorResponse.model_construct(
+        id=connector.id,
+        key=connector.key,
+        name=connector.name,
+        config_schema=connector.config_schema,
+        supports_oauth=supports_oauth,
+        oauth_scopes=list(oauth_scopes),
+        created_at=connector.created_at
+    )
+
+
+def _plugin_connector_response(plugin: ConnectorPlugin) -> ConnectorResponse:
+    """
+    Build a temporary response for a plugin whose connector is not stored yet (see above).
+
+    created_at is PLUGIN_CONNECTORS_CREATED_AT, so the response is identical across requests.
+    """
+    supports_oauth, oauth_scopes = plugin.oauth_capabilities
+    return ConnectorResponse.model_construct(
+        id=0,  # Temporary ID for plugins not in DB
+        key=plugin.metadata.key,
+        name=plugin.metadata.name,
+        config_schema=plugin.config_schema,
+        supports_oauth=supports_oauth,
+        oauth_scopes=list(oauth_scopes),
+        created_at=PLUGIN_CONNECTORS_CREATED_AT
+    )
+
+
 # PUBLIC_INTERFACE
 @router.get("/{connector_key}", response_model=ConnectorResponse)
-async def get_connector(connector_key: str, db: Session = Depends(get_db)):
+def get_connector(
+    connector_key: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """
     Get detailed information about a specific connector.
     
@@ -70,13 +186,13 @@ async def get_connector(connector_key: str, db: Session = Depends(get_db)):
         connector_key: Unique identifier for the connector
         
     Returns:
-        Detailed connector information including configuration schema
+        Detailed connector information including configuration schema;
+        an empty 304 when If-None-Match matches the response ETag
     """
     # Try to get from database first
-    stored_connector = db.query(Connector).filter(Connector.key == connector_key).first()
+    stored_connector = db.query(Connector).options(*loader_options()).filter(Connector.key == connector_key).first()
     
-    # Get plugin info
-    plugin = plugin_manager.get_plugin(connector_key)
+    plugin = get_plugin_manager().get_plugin(connector_key)
     
     if not stored_connector and not plugin:
         raise HTTPException(
@@ -85,33 +201,18 @@ async def get_connector(connector_key: str, db: Session = Depends(get_db)):
         )
     
     if stored_connector:
-        return ConnectorResponse(
-            id=stored_connector.id,
-            key=stored_connector.key,
-            name=stored_connector.name,
-            config_schema=stored_connector.config_schema,
-            supports_oauth=(plugin.metadata.supports_oauth if plugin else False),
-            oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-            created_at=stored_connector.created_at
-        )
+        response = _stored_connector_response(stored_connector, plugin)
     else:
         # Return plugin info for connectors not yet stored
-        from datetime import datetime
-        return ConnectorResponse(
-            id=0,
-            key=plugin.metadata.key,
-            name=plugin.metadata.name,
-            config_schema=plugin.get_config_schema(),
-            supports_oauth=plugin.metadata.supports_oauth,
-            oauth_scopes=plugin.metadata.oauth_scopes,
-            created_at=datetime.utcnow()
-        )
+        response = _plugin_connector_response(plugin)
+    body, etag = _with_etag(orjson.dumps(response.model_dump()))
+    return _conditional_json_response(body, etag, if_none_match)
 
 
 # PUBLIC_INTERFACE
 @router.post("/", response_model=ConnectorResponse, status_code=status.HTTP_201_CREATED)
-async def create_connector(
-    connector_data: dict,
+def create_connector(
+    connector_data: ConnectorCreate,
     db: Session = Depends(get_db)
 ):
     """
@@ -126,44 +227,34 @@ async def create_connector(
     Returns:
         Created connector information
     """
-    # Check if connector key already exists
-    existing = db.query(Connector).filter(Connector.key == connector_data.get("key")).first()
-    if existing:
+    # Check if connector key already exists (EXISTS avoids loading the row and its config_schema)
+    if db.execute(select(exists().where(Connector.key == connector_data.key))).scalar():
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Connector with key '{connector_data.get('key')}' already exists"
+            detail=f"Connector with key '{connector_data.key}' already exists"
         )
     
     # Create new connector
     connector = Connector(
-        key=connector_data["key"],
-        name=connector_data["name"],
-        config_schema=connector_data.get("config_schema")
+        key=connector_data.key,
+        name=connector_data.name,
+        config_schema=connector_data.config_schema
     )
     
     db.add(connector)
     db.commit()
+    response_cache.invalidate(CONNECTORS_LIST_KEY)
     db.refresh(connector)
     
-    # Get plugin info if available
-    plugin = plugin_manager.get_plugin(connector.key)
-    
-    return ConnectorResponse(
-        id=connector.id,
-        key=connector.key,
-        name=connector.name,
-        config_schema=connector.config_schema,
-        supports_oauth=plugin is not None,
-        oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-        created_at=connector.created_at
-    )
+    # Enrich with plugin info if available
+    return _stored_connector_response(connector, get_plugin_manager().get_plugin(connector.key))
 
 
 # PUBLIC_INTERFACE
 @router.put("/{connector_key}", response_model=ConnectorResponse)
-async def update_connector(
+def update_connector(
     connector_key: str,
-    connector_data: dict,
+    connector_data: ConnectorUpdate,
     db: Session = Depends(get_db)
 ):
     """
@@ -176,43 +267,39 @@ async def update_connector(
     Returns:
         Updated connector information
     """
-    connector = db.query(Connector).filter(Connector.key == connector_key).first()
-    if not connector:
+    # Update fields with a single UPDATE ... RETURNING; no row back means the connector doesn't exist
+    values = connector_data.model_dump(exclude_unset=True)
+    if values.get("name") is None:
+        # name is NOT NULL; an explicit null leaves it unchanged
+        values.pop("name", None)
+    if values:
+        stmt = update(Connector).where(Connector.key == connector_key).values(**values).returning(Connector)
+    else:
+        stmt = select(Connector).where(Connector.key == connector_key)
+    connector = db.execute(stmt).scalar_one_or_none()
+    if connector is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Connector '{connector_key}' not found"
         )
     
-    # Update fields
-    if "name" in connector_data:
-        connector.name = connector_data["name"]
-    if "config_schema" in connector_data:
-        connector.config_schema = connector_data["config_schema"]
-    
+    # Enrich with plugin info if available; built before commit expires the returned row
+    response = _stored_connector_response(connector, get_plugin_manager().get_plugin(connector.key))
     db.commit()
-    db.refresh(connector)
+    if values:
+        response_cache.invalidate(CONNECTORS_LIST_KEY)
     
-    # Get plugin info if available
-    plugin = plugin_manager.get_plugin(connector.key)
-    
-    return ConnectorResponse(
-        id=connector.id,
-        key=connector.key,
-        name=connector.name,
-        config_schema=connector.config_schema,
-        supports_oauth=plugin is not None,
-        oauth_scopes=plugin.metadata.oauth_scopes if plugin else [],
-        created_at=connector.created_at
-    )
+    return response
 
 
 # PUBLIC_INTERFACE
 @router.delete("/{connector_key}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_connector(connector_key: str, db: Session = Depends(get_db)):
+def delete_connector(connector_key: str, db: Session = Depends(get_db)):
     """
     Delete a connector from the database.
     
     Note: This only removes the database record, not the plugin implementation.
+    The connector's connections and their OAuth tokens are deleted with it.
     
     Args:
         connector_key: Unique identifier for the connector
@@ -224,5 +311,11 @@ async def delete_connector(connector_key: str, db: Session = Depends(get_db)):
             detail=f"Connector '{connector_key}' not found"
         )
     
+    # Collected before the cascade removes them, so their cached tokens can be dropped
+    connection_ids = db.execute(select(Connection.id).where(Connection.connector_id == connector.id)).scalars().all()
+    
     db.delete(connector)
     db.commit()
+    response_cache.invalidate(CONNECTORS_LIST_KEY)
+    for connection_id in connection_ids:
+        token_cache.invalidate(connection_id)
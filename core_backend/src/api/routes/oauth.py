@@ -1,12 +1,19 @@
 """OAuth API routes for handling OAuth authorization flows."""
+import asyncio
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import Session
 
 from src.database.connection import get_db
 from src.models.connection import Connection
+from src.models.connector import Connector
 from src.models.oauth_token import OAuthToken
-from src.services.plugin_manager import plugin_manager
+from src.plugins.base import TokenResponse
+from src.services.oauth_token_repository import oauth_token_repo
+from src.services.plugin_manager import get_plugin_manager
+from src.services.token_cache import token_cache
 from src.auth.jwt import get_current_user_optional
 from src.auth.oauth import oauth_helper, validate_oauth_callback
 from src.api.schemas import (
@@ -15,7 +22,8 @@ from src.api.schemas import (
     OAuthCallbackResponse
 )
 
-router = APIRouter(prefix="/oauth", tags=["oauth"])
+# Serialize with orjson even when the router is mounted on an app with a different default
+router = APIRouter(prefix="/oauth", tags=["oauth"], default_response_class=ORJSONResponse)
 
 
 def get_current_user(authorization: Optional[str] = Header(None)) -> Optional[Dict[str, Any]]:
@@ -25,7 +33,7 @@ def get_current_user(authorization: Optional[str] = Header(None)) -> Optional[Di
 
 # PUBLIC_INTERFACE
 @router.get("/{connector_key}/authorize", response_model=OAuthAuthorizeResponse, summary="Initiate OAuth", description="Initiate OAuth authorization flow for a connector and return authorization URL and signed state.", operation_id="initiate_oauth")
-async def initiate_oauth(
+def initiate_oauth(
     connector_key: str,
     connection_id: Optional[int] = Query(None, description="Existing connection ID to associate with OAuth"),
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user),
@@ -41,7 +49,7 @@ async def initiate_oauth(
     Returns:
         Authorization URL and state parameter for OAuth flow
     """
-    plugin = plugin_manager.get_plugin(connector_key)
+    plugin = get_plugin_manager().get_plugin(connector_key)
     if not plugin:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Connector '{connector_key}' not found")
 
@@ -125,7 +133,7 @@ async def _process_oauth_callback(
     if not code or not state:
         return OAuthCallbackResponse(success=False, message="Missing required OAuth parameters")
 
-    plugin = plugin_manager.get_plugin(connector_key)
+    plugin = get_plugin_manager().get_plugin(connector_key)
     if not plugin:
         return OAuthCallbackResponse(success=False, message=f"Connector '{connector_key}' not found")
 
@@ -142,18 +150,9 @@ async def _process_oauth_callback(
     try:
         token_data = await plugin.handle_oauth_callback(code, state)
         if connection_id:
-            connection = db.query(Connection).filter(Connection.id == connection_id).first()
-            if connection:
-                db.query(OAuthToken).filter(OAuthToken.connection_id == connection_id).delete()
-                oauth_token = OAuthToken(
-                    connection_id=connection_id,
-                    access_token=token_data.get("access_token"),
-                    refresh_token=token_data.get("refresh_token"),
-                    expires_at=token_data.get("expires_at")
-                )
-                db.add(oauth_token)
-                connection.status = "active"
-                db.commit()
+            # Blocking database work runs in a worker thread, off the event loop
+            if await asyncio.to_thread(_activate_connection_with_tokens, db, connection_id, token_data):
+                token_cache.invalidate(connection_id)
                 return OAuthCallbackResponse(success=True, message="OAuth authorization successful", connection_id=connection_id)
 
         return OAuthCallbackResponse(success=True, message="OAuth authorization successful (tokens not stored - no connection specified)")
@@ -161,9 +160,28 @@ async def _process_oauth_callback(
         return OAuthCallbackResponse(success=False, message=f"OAuth callback failed: {str(e)}")
 
 
+def _activate_connection_with_tokens(db: Session, connection_id: int, tokens: TokenResponse) -> bool:
+    """
+    Activate a connection and store its tokens in one transaction (blocking; run in a worker thread).
+
+    Returns:
+        bool: False if the connection does not exist (nothing is written)
+    """
+    # Activate the connection; an empty RETURNING means it doesn't exist
+    activated = db.execute(
+        update(Connection).where(Connection.id == connection_id).values(status="active").returning(Connection.id)
+    ).scalar_one_or_none()
+    if activated is None:
+        return False
+    # Replace the connection's token in place
+    oauth_token_repo.upsert(db, connection_id, tokens)
+    db.commit()
+    return True
+
+
 # PUBLIC_INTERFACE
 @router.delete("/{connector_key}/revoke/{connection_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Revoke OAuth token", description="Revoke stored OAuth tokens for a specific connection", operation_id="revoke_oauth_token")
-async def revoke_oauth_token(
+def revoke_oauth_token(
     connector_key: str,
     connection_id: int,
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user),
@@ -175,15 +193,22 @@ async def revoke_oauth_token(
     if not current_user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication required")
 
-    connection = db.query(Connection).options(joinedload(Connection.connector)).filter(
-        Connection.id == connection_id, Connection.user_id == current_user["user_id"]
-    ).first()
+    owned = (Connection.id == connection_id, Connection.user_id == current_user["user_id"])
+
+    # Ownership check, connector match and status update in one UPDATE ... RETURNING
+    revoked = db.execute(
+        update(Connection)
+        .where(*owned, Connection.connector_id == select(Connector.id).where(Connector.key == connector_key).scalar_subquery())
+        .values(status="inactive")
+        .returning(Connection.id)
+    ).scalar_one_or_none()
 
-    if not connection:
+    if revoked is None:
+        # Nothing updated: tell a foreign/missing connection apart from a connector key mismatch
+        if db.execute(select(exists().where(*owned))).scalar():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Connector key mismatch")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Connection not found")
-    if connection.connector.key != connector_key:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Connector key mismatch")
 
-    db.query(OAuthToken).filter(OAuthToken.connection_id == connection_id).delete()
-    connection.status = "inactive"
+    db.execute(delete(OAuthToken).where(OAuthToken.connection_id == connection_id))
     db.commit()
+    token_cache.invalidate(connection_id)
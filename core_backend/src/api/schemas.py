@@ -1,7 +1,41 @@
 """Pydantic schemas for API request/response models."""
+import math
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from typing_extensions import Annotated
+
+# Range of integers the orjson response encoder can write (signed/unsigned 64-bit)
+_JSON_INT_MIN = -(2 ** 63)
+_JSON_INT_MAX = 2 ** 64 - 1
+
+
+def _check_json_numbers(value: Any) -> Any:
+    """
+    Reject numbers that cannot be sent back in a JSON response.
+
+    Raises:
+        ValueError: If an integer does not fit in 64 bits or a float is NaN/Infinity (422)
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, bool):
+            continue
+        elif isinstance(item, int):
+            if not _JSON_INT_MIN <= item <= _JSON_INT_MAX:
+                raise ValueError("integers must fit in 64 bits")
+        elif isinstance(item, float) and not math.isfinite(item):
+            raise ValueError("numbers must be finite")
+    return value
+
+
+# User-supplied JSON object stored in a JSON column and returned as-is by later responses
+JsonObject = Annotated[Dict[str, Any], AfterValidator(_check_json_numbers)]
 
 
 class ConnectorResponse(BaseModel):
@@ -14,19 +48,32 @@ class ConnectorResponse(BaseModel):
     oauth_scopes: List[str] = Field(default_factory=list, description="List of OAuth scopes required by connector")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    class Config:
-        from_attributes = True
+    # Built once per row and never mutated afterwards
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ConnectorCreate(BaseModel):
+    """Request model for creating a custom connector."""
+    key: str = Field(..., min_length=1, max_length=100, description="Connector unique key")
+    name: str = Field(..., min_length=1, max_length=200, description="Connector display name")
+    config_schema: Optional[JsonObject] = Field(None, description="JSON schema for connector configuration")
+
+
+class ConnectorUpdate(BaseModel):
+    """Request model for updating a connector; only fields present in the body are changed."""
+    name: Optional[str] = Field(None, min_length=1, max_length=200, description="Connector display name")
+    config_schema: Optional[JsonObject] = Field(None, description="JSON schema for connector configuration")
 
 
 class ConnectionCreate(BaseModel):
     """Request model for creating a connection."""
-    connector_key: str = Field(..., description="Connector key identifier")
-    config_data: Optional[Dict[str, Any]] = Field(None, description="Connector configuration data")
+    connector_key: str = Field(..., min_length=1, description="Connector key identifier")
+    config_data: Optional[JsonObject] = Field(None, description="Connector configuration data")
 
 
 class ConnectionUpdate(BaseModel):
     """Request model for updating a connection."""
-    config_data: Optional[Dict[str, Any]] = Field(None, description="Connector configuration data")
+    config_data: Optional[JsonObject] = Field(None, description="Connector configuration data")
     status: Optional[str] = Field(None, description="Connection status")
 
 
@@ -41,8 +88,8 @@ class ConnectionResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     has_oauth_token: bool = Field(default=False, description="Whether an OAuth token is stored for this connection")
 
-    class Config:
-        from_attributes = True
+    # Built once per row and never mutated afterwards
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class OAuthAuthorizeResponse(BaseModel):
@@ -53,8 +100,8 @@ class OAuthAuthorizeResponse(BaseModel):
 
 class OAuthCallbackRequest(BaseModel):
     """Request model for OAuth callback handling."""
-    code: str = Field(..., description="Authorization code from provider")
-    state: str = Field(..., description="State token returned by provider")
+    code: str = Field(..., min_length=1, description="Authorization code from provider")
+    state: str = Field(..., min_length=1, description="State token returned by provider")
     connection_id: Optional[int] = Field(None, description="Optional connection to attach tokens to")
 
 
@@ -0,0 +1,35 @@
+"""Unpadded base64url helpers shared by the JWT and OAuth state token codecs."""
+# SIMD-accelerated drop-in for the stdlib base64 codec
+import pybase64
+
+
+# PUBLIC_INTERFACE
+def b64url_encode(data: bytes) -> str:
+    """
+    Encode bytes as unpadded base64url text (RFC 7515 section 2).
+
+    Args:
+        data: Raw bytes
+
+    Returns:
+        str: base64url text without '=' padding
+    """
+    return pybase64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+# PUBLIC_INTERFACE
+def b64url_decode(data: str) -> bytes:
+    """
+    Decode unpadded base64url text.
+
+    Args:
+        data: base64url text, with or without padding
+
+    Returns:
+        bytes: Decoded bytes
+
+    Raises:
+        ValueError: If data is not valid base64url (binascii.Error)
+    """
+    padding = "=" * (-len(data) % 4)
+    return pybase64.urlsafe_b64decode(data + padding)
@@ -1,23 +1,74 @@
 """JWT utilities for authentication and authorization."""
-import os
-from datetime import datetime, timedelta
+import binascii
+import hashlib
+import hmac
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+import orjson
 from fastapi import HTTPException, status
 
+from src.auth.encoding import b64url_decode, b64url_encode
+from src.config.settings import JWT_SECRET_BYTES, Settings, settings
+
 
 class JWTManager:
     """Manager for JWT token operations."""
     
     def __init__(self):
-        """Initialize JWT manager with secret from environment."""
-        self.secret_key = os.getenv("JWT_SECRET", "dev-secret-key-change-in-production")
+        """Initialize JWT manager with the secret from settings (JWT_SECRET env var or .env)."""
+        self.secret_key = settings.jwt_secret
         self.algorithm = "HS256"
         self.access_token_expire_minutes = 30
         
         # Warn if using default secret
-        if self.secret_key == "dev-secret-key-change-in-production":
+        if self.secret_key == Settings.model_fields["jwt_secret"].default:
             print("WARNING: Using default JWT secret. Set JWT_SECRET environment variable for production.")
+        
+        # The algorithm is fixed, so the encoded header and the keyed HMAC are prepared once;
+        # each token then costs one orjson encode, one HMAC-SHA256 and the base64url steps
+        self._header_b64 = b64url_encode(orjson.dumps({"alg": self.algorithm, "typ": "JWT"}))
+        self._mac = hmac.new(JWT_SECRET_BYTES, digestmod=hashlib.sha256)
+    
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the HS256 signature from a copy of the precomputed keyed HMAC."""
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+    
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify an HS256 token's signature and time claims and return its payload.
+        
+        Raises:
+            ValueError: If the token is malformed, not HS256, badly signed, expired or not yet valid
+        """
+        parts = token.split(".", 2)
+        if len(parts) != 3 or "." in parts[2]:
+            raise ValueError("Malformed token")
+        header_b64, payload_b64, sig_b64 = parts
+        try:
+            # Nothing from the token is parsed until its signature checks out
+            if not hmac.compare_digest(self._sign(f"{header_b64}.{payload_b64}".encode()), b64url_decode(sig_b64)):
+                raise ValueError("Invalid token signature")
+            # Tokens we issue carry exactly the precomputed header; anything else must still declare HS256
+            if header_b64 != self._header_b64:
+                header = orjson.loads(b64url_decode(header_b64))
+                if not isinstance(header, dict):
+                    raise ValueError("Malformed token")
+                if header.get("alg") != self.algorithm:
+                    raise ValueError("Unsupported token algorithm")
+            payload = orjson.loads(b64url_decode(payload_b64))
+        except (orjson.JSONDecodeError, binascii.Error) as exc:
+            raise ValueError("Malformed token") from exc
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid token payload")
+        now = int(time.time())
+        if "exp" in payload and int(payload["exp"]) < now:
+            raise ValueError("Token expired")
+        if "nbf" in payload and int(payload["nbf"]) > now:
+            raise ValueError("Token not yet valid")
+        return payload
     
     # PUBLIC_INTERFACE
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -32,14 +83,15 @@ class JWTManager:
             str: Encoded JWT token
         """
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        if not expires_delta:
+            expires_delta = timedelta(minutes=self.access_token_expire_minutes)
         
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        # NumericDate (seconds since epoch), as RFC 7519 requires
+        to_encode.update({"exp": int(time.time() + expires_delta.total_seconds())})
+        # orjson emits compact JSON as bytes, so there is no separate encode step
+        payload_b64 = b64url_encode(orjson.dumps(to_encode))
+        signing_input = f"{self._header_b64}.{payload_b64}"
+        return f"{signing_input}.{b64url_encode(self._sign(signing_input.encode()))}"
     
     # PUBLIC_INTERFACE
     def verify_token(self, token: str) -> Dict[str, Any]:
@@ -56,9 +108,8 @@ class JWTManager:
             HTTPException: If token is invalid or expired
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
-        except JWTError:
+            return self._decode(token)
+        except (ValueError, TypeError):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
@@ -1,30 +1,41 @@
 """OAuth utilities for handling authorization flows."""
-import base64
 import hmac
 import hashlib
-import json
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
-from urllib.parse import urlencode, urlparse, parse_qs
+import secrets
+import time
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit
+import orjson
 
-from src.config import settings
+from src.auth.encoding import b64url_decode as _b64url_decode, b64url_encode as _b64url
+from src.config import FRONTEND_BASE_URL, JWT_SECRET_BYTES
 
+# Encoded header of every state token; constant, so it is built once at import
+_STATE_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"STATE"}')
 
-def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).decode("utf-8").rstrip("=")
 
-
-def _b64url_decode(data: str) -> bytes:
-    padding = "=" * (-len(data) % 4)
-    return base64.urlsafe_b64decode(data + padding)
+@lru_cache(maxsize=16)
+def _redirect_uri(frontend_base: str) -> str:
+    """Build the frontend callback URI once per frontend base URL."""
+    return f"{frontend_base}/oauth/callback"
 
 
 class OAuthHelper:
     """Helper class for OAuth operations with signed state support."""
     def __init__(self):
         """Initialize using env-driven settings."""
-        self.frontend_base = settings.frontend_base_url
-        self.jwt_secret = settings.jwt_secret.encode("utf-8")
+        self.frontend_base = FRONTEND_BASE_URL
+        self.jwt_secret = JWT_SECRET_BYTES
+        # Keyed HMAC-SHA256 (OpenSSL-backed hashlib) prepared once; signing copies it instead
+        # of redoing the key setup on every request
+        self._state_mac = hmac.new(self.jwt_secret, digestmod=hashlib.sha256)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the state signature from a copy of the precomputed keyed HMAC."""
+        mac = self._state_mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
 
     # PUBLIC_INTERFACE
     def generate_state(self, connector_key: Optional[str] = None, connection_id: Optional[int] = None, ttl_seconds: int = 600) -> str:
@@ -39,24 +50,21 @@ class OAuthHelper:
         Returns:
             str: Signed state token
         """
-        now = datetime.now(timezone.utc)
-        payload = {
-            "iat": int(now.timestamp()),
-            "exp": int((now + timedelta(seconds=ttl_seconds)).timestamp()),
-            "nonce": _b64url(hashlib.sha256(str(now.timestamp()).encode()).digest()[:12]),
-        }
+        now_ts = int(time.time())
+        # Random nonce from the OS CSPRNG keeps tokens issued in the same instant distinct
+        nonce = _b64url(secrets.token_bytes(12))
+
+        payload: Dict[str, Any] = {"iat": now_ts, "exp": now_ts + int(ttl_seconds), "nonce": nonce}
         if connector_key:
             payload["connector"] = connector_key
         if connection_id is not None:
-            payload["connection_id"] = connection_id
+            payload["connection_id"] = int(connection_id)
 
-        header = {"alg": "HS256", "typ": "STATE"}
-        encoded_header = _b64url(json.dumps(header, separators=(",", ":")).encode())
-        encoded_payload = _b64url(json.dumps(payload, separators=(",", ":")).encode())
-        signing_input = f"{encoded_header}.{encoded_payload}".encode()
-        signature = hmac.new(self.jwt_secret, signing_input, hashlib.sha256).digest()
-        encoded_sig = _b64url(signature)
-        return f"{encoded_header}.{encoded_payload}.{encoded_sig}"
+        # orjson emits compact JSON as bytes, so there is no separate encode step
+        encoded_payload = _b64url(orjson.dumps(payload))
+        signing_input = f"{_STATE_HEADER_B64}.{encoded_payload}"
+        encoded_sig = _b64url(self._sign(signing_input.encode()))
+        return f"{signing_input}.{encoded_sig}"
 
     # PUBLIC_INTERFACE
     def verify_state(self, state: str) -> Dict[str, Any]:
@@ -70,24 +78,29 @@ class OAuthHelper:
             Dict[str, Any]: Decoded and verified payload
 
         Raises:
-            ValueError: If invalid signature or expired
+            ValueError: If malformed, invalid signature or expired
         """
+        # Every rejection below raises ValueError directly; there is no catch-all wrapper, so
+        # forged or garbage states fail without an extra frame and message re-format
+        # Exactly three segments: split at most twice and reject a dot in the signature
+        parts = state.split(".", 2)
+        if len(parts) != 3 or "." in parts[2]:
+            raise ValueError("Malformed state")
+        header_b64, payload_b64, sig_b64 = parts
+        # Signature is checked before the payload is parsed (binascii.Error and
+        # orjson.JSONDecodeError below are both ValueError subclasses)
+        expected_sig = self._sign(f"{header_b64}.{payload_b64}".encode())
+        if not hmac.compare_digest(expected_sig, _b64url_decode(sig_b64)):
+            raise ValueError("Invalid state signature")
         try:
-            parts = state.split(".")
-            if len(parts) != 3:
-                raise ValueError("Malformed state")
-            header_b64, payload_b64, sig_b64 = parts
-            signing_input = f"{header_b64}.{payload_b64}".encode()
-            expected_sig = hmac.new(self.jwt_secret, signing_input, hashlib.sha256).digest()
-            if not hmac.compare_digest(expected_sig, _b64url_decode(sig_b64)):
-                raise ValueError("Invalid state signature")
-            payload = json.loads(_b64url_decode(payload_b64))
-            now = int(datetime.now(timezone.utc).timestamp())
-            if payload.get("exp") is not None and now > int(payload["exp"]):
-                raise ValueError("State expired")
-            return payload
-        except Exception as e:
-            raise ValueError(f"State verification failed: {e}")
+            payload = orjson.loads(_b64url_decode(payload_b64))
+            exp = payload.get("exp")
+            expired = exp is not None and int(time.time()) > int(exp)
+        except (ValueError, TypeError, AttributeError):
+            raise ValueError("Malformed state payload") from None
+        if expired:
+            raise ValueError("State expired")
+        return payload
 
     # PUBLIC_INTERFACE
     def build_redirect_uri(self, provider: str) -> str:
@@ -102,8 +115,9 @@ class OAuthHelper:
         Returns:
             str: Redirect URI expected by providers (frontend callback)
         """
-        # Unified frontend callback; provider can be passed in state if needed by FE
-        return f"{self.frontend_base}/oauth/callback"
+        # Unified frontend callback; provider can be passed in state if needed by FE.
+        # The URI depends only on the frontend base, so it is cached rather than rebuilt per call
+        return _redirect_uri(self.frontend_base)
 
     # PUBLIC_INTERFACE
     def build_authorize_url(self, base_url: str, params: Dict[str, Any]) -> str:
@@ -117,7 +131,11 @@ class OAuthHelper:
         Returns:
             str: Complete authorization URL
         """
-        query_string = urlencode(params, doseq=True)
+        if any(isinstance(value, (list, tuple)) for value in params.values()):
+            query_string = urlencode(params, doseq=True)
+        else:
+            # Authorize params are flat scalars: same output as urlencode without its per-value dispatch
+            query_string = "&".join(f"{quote_plus(key)}={quote_plus(str(value))}" for key, value in params.items())
         return f"{base_url}?{query_string}"
 
     # PUBLIC_INTERFACE
@@ -129,14 +147,15 @@ class OAuthHelper:
             callback_url: Complete callback URL with parameters
 
         Returns:
-            Dict: Parsed callback parameters
+            Dict: Parsed callback parameters (first value wins for repeated keys)
+
+        Raises:
+            ValueError: If the query has more than 32 fields
         """
-        parsed_url = urlparse(callback_url)
-        params = parse_qs(parsed_url.query)
+        # Single pass over (key, value) pairs; blank values are dropped as parse_qs did
         result = {}
-        for key, value_list in params.items():
-            if value_list:
-                result[key] = value_list[0]
+        for key, value in parse_qsl(urlsplit(callback_url).query, max_num_fields=32):
+            result.setdefault(key, value)
         return result
 
     # PUBLIC_INTERFACE
@@ -161,8 +180,15 @@ class OAuthHelper:
 oauth_helper = OAuthHelper()
 
 
+class OAuthSessionData(NamedTuple):
+    """Session data for an OAuth flow: an immutable tuple with named fields instead of a dict."""
+    provider: str
+    state: str
+    user_id: Optional[int] = None
+
+
 # PUBLIC_INTERFACE
-def create_oauth_session_data(provider: str, state: str, user_id: Optional[int] = None) -> Dict[str, Any]:
+def create_oauth_session_data(provider: str, state: str, user_id: Optional[int] = None) -> OAuthSessionData:
     """
     Create session data for OAuth flow. (Stateless signed state used.)
 
@@ -172,13 +198,9 @@ def create_oauth_session_data(provider: str, state: str, user_id: Optional[int]
         user_id: Optional user ID if user is authenticated
 
     Returns:
-        Dict: Session data for OAuth flow
+        OAuthSessionData: Session data for OAuth flow (read fields as attributes, e.g. `.provider`)
     """
-    return {
-        "provider": provider,
-        "state": state,
-        "user_id": user_id,
-    }
+    return OAuthSessionData(provider, state, user_id)
 
 
 # PUBLIC_INTERFACE
@@ -1,4 +1,4 @@
 """Configuration package initialization."""
-from .settings import settings
+from .settings import FRONTEND_BASE_URL, JWT_SECRET_BYTES, settings
 
-__all__ = ["settings"]
+__all__ = ["settings", "FRONTEND_BASE_URL", "JWT_SECRET_BYTES"]
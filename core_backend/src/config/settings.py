@@ -8,10 +8,31 @@ class Settings(BaseSettings):
     # Database configuration
     # Prefer DATABASE_URL if provided (common with Alembic/SQLAlchemy), fallback to database_url
     database_url: str = Field(default="sqlite:///./connector_framework.db", alias="DATABASE_URL")
+    # Connection pool sizing (PostgreSQL); size roughly as cpu_cores * 2 + effective_spindle_count
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")  # seconds
+    # Serverless/short-lived deployments: open a connection per checkout (NullPool) instead of pooling
+    serverless: bool = Field(default=False, alias="SERVERLESS")
 
     # Application settings
     app_name: str = "Connector Framework Manager"
     debug: bool = False
+    # Serve OpenAPI schema and docs UIs; disable in production containers to skip schema building
+    enable_openapi: bool = Field(default=True, alias="ENABLE_OPENAPI")
+    # Register /healthz and /readyz container probes
+    enable_probes: bool = Field(default=True, alias="ENABLE_PROBES")
+    # Register the unauthenticated /metrics endpoint (database pool statistics); off by default
+    enable_metrics: bool = Field(default=False, alias="ENABLE_METRICS")
+    # Seconds cached read responses (e.g. GET /connectors/) stay fresh; 0 disables caching
+    response_cache_ttl: int = Field(default=300, alias="RESPONSE_CACHE_TTL")
+    # Seconds a cached OAuth token is trusted before it is re-read from the database; kept short
+    # because a revoke handled by another worker is only seen once this expires (0 disables)
+    token_cache_ttl: int = Field(default=5, alias="TOKEN_CACHE_TTL")
+    # Tokens expiring within this many seconds are refreshed in the background while still in use
+    token_refresh_window: int = Field(default=300, alias="TOKEN_REFRESH_WINDOW")
+    # Seconds between background scans for tokens nearing expiry; 0 disables the scheduler
+    token_refresh_interval: int = Field(default=60, alias="TOKEN_REFRESH_INTERVAL")
 
     # URL configuration
     backend_base_url: str = Field(default="http://localhost:3001", alias="BACKEND_BASE_URL")
@@ -37,8 +58,16 @@ class Settings(BaseSettings):
     datadog_client_id: str = Field(default="", alias="DATADOG_CLIENT_ID")
     datadog_client_secret: str = Field(default="", alias="DATADOG_CLIENT_SECRET")
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    # Frozen: settings are read once at startup and never mutated at runtime.
+    # Defaults above are already well-typed, so only values read from env/.env are validated.
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True, validate_default=False
+    )
 
 
 # Global settings instance
 settings = Settings()
+
+# Hot-path values derived once; settings is frozen, so they can't go stale
+JWT_SECRET_BYTES: bytes = settings.jwt_secret.encode("utf-8")
+FRONTEND_BASE_URL: str = settings.frontend_base_url
@@ -1,4 +1,4 @@
 """Database package initialization."""
-from .connection import SessionLocal, engine, get_db
+from .connection import SessionLocal, engine, get_db, loader_options, ping, pool_status, upsert_insert
 
-__all__ = ["SessionLocal", "engine", "get_db"]
+__all__ = ["SessionLocal", "engine", "get_db", "loader_options", "ping", "pool_status", "upsert_insert"]
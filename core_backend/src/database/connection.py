@@ -2,25 +2,50 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator, Iterator
+from typing import Any, Dict, Generator, Iterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import declarative_base, raiseload, sessionmaker, Session
+from sqlalchemy.pool import NullPool, QueuePool
 
 from src.config.settings import settings
 
 # Get database URL from settings (env-driven through pydantic-settings)
 DATABASE_URL = settings.database_url
+IS_POSTGRES = DATABASE_URL.startswith("postgresql")
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
 
 # Engine configuration:
-# - Use NullPool for serverless/dev environments to avoid lingering connections
-# - For SQLite, set check_same_thread=False
+# - PostgreSQL uses an explicitly sized QueuePool so connections are reused across requests;
+#   pre-ping drops dead connections and recycling avoids server-side idle timeouts
+# - With SERVERLESS set, PostgreSQL uses NullPool so no connections linger between invocations
+# - For SQLite, set check_same_thread=False and keep SQLAlchemy's default pool
+# - JSON columns (config_schema, config_data) keep SQLAlchemy's stdlib json codec: user-supplied
+#   config may hold integers wider than 64 bits or NaN, which orjson cannot encode or decode exactly
+_engine_options: Dict[str, Any] = {}
+if IS_POSTGRES:
+    if settings.serverless:
+        _engine_options = {"poolclass": NullPool}
+    else:
+        _engine_options = {
+            "poolclass": QueuePool,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.db_pool_recycle,
+            # Reuse the most recently returned connection so a few stay warm and the
+            # surplus sits idle until pool_recycle retires it
+            "pool_use_lifo": True,
+        }
+if IS_SQLITE:
+    _engine_options["connect_args"] = {"check_same_thread": False}
 engine = create_engine(
     DATABASE_URL,
-    poolclass=NullPool if DATABASE_URL.startswith("postgresql") else None,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
     future=True,
+    **_engine_options,
 )
 
 # Session factory with typing
@@ -29,6 +54,12 @@ SessionLocal: sessionmaker[Session] = sessionmaker(bind=engine, autocommit=False
 # Declarative Base
 Base = declarative_base()
 
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
 
 # PUBLIC_INTERFACE
 def get_db() -> Generator[Session, None, None]:
@@ -46,6 +77,83 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# PUBLIC_INTERFACE
+def pool_status() -> Dict[str, Any]:
+    """
+    Report connection pool usage for saturation monitoring.
+
+    Returns:
+        Dict[str, Any]: Pool class name plus size/checkedin/checkedout/overflow
+        counters when the pool implementation exposes them
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        stat = getattr(pool, name, None)
+        if callable(stat):
+            status[name] = stat()
+    return status
+
+
+# PUBLIC_INTERFACE
+def ping() -> bool:
+    """
+    Check that the database answers a trivial query.
+
+    The connection is checked out in a context manager, so it always goes back to the pool.
+
+    Returns:
+        bool: True if the database responded, False otherwise
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        return False
+    return True
+
+
+# PUBLIC_INTERFACE
+def loader_options(*options) -> tuple:
+    """
+    Build loader options for route-level queries.
+
+    In debug mode raiseload('*') is appended so any relationship the query did not
+    eagerly load raises instead of silently issuing a follow-up SELECT (N+1 guard).
+
+    Args:
+        options: Eager-loading options the query relies on (e.g. joinedload(...))
+
+    Returns:
+        tuple: Options to pass to Query.options()/Select.options()
+    """
+    if settings.debug:
+        return (*options, raiseload("*"))
+    return options
+
+
+# PUBLIC_INTERFACE
+def upsert_insert(db: Session, model):
+    """
+    Build an INSERT for the session's dialect that supports ON CONFLICT clauses.
+
+    Args:
+        db: Active database session (used to resolve the dialect)
+        model: Mapped class or table to insert into
+
+    Returns:
+        Insert: Dialect insert exposing on_conflict_do_nothing/on_conflict_do_update
+
+    Raises:
+        NotImplementedError: If the dialect has no native upsert support
+    """
+    dialect = db.get_bind().dialect.name
+    insert_factory = _UPSERT_INSERTS.get(dialect)
+    if insert_factory is None:
+        raise NotImplementedError(f"Upsert is not supported for dialect '{dialect}'")
+    return insert_factory(model)
+
+
 @contextmanager
 def db_session() -> Iterator[Session]:
     """
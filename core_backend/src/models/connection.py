@@ -1,9 +1,11 @@
 """Connection model for user-connector relationships."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Index, UniqueConstraint, exists, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import column_property, relationship
 
 from src.database.connection import Base
+from src.models.oauth_token import OAuthToken
 
 
 class Connection(Base):
@@ -17,19 +19,44 @@ class Connection(Base):
         config_data: JSON data containing connector-specific configuration (JSONB on Postgres)
         status: Connection status (active, inactive, error)
         created_at: Timestamp when connection was created
+        has_oauth_token: Whether OAuth tokens are stored, computed in SQL with a correlated EXISTS
         user: Relationship to the user who owns this connection
         connector: Relationship to the connector this connection uses
         oauth_tokens: Relationship to OAuth tokens for this connection
     """
     __tablename__ = "connections"
+    # Mirrors the indexes created by the migrations so autogenerate sees them as managed:
+    # - (user_id, connector_id) unique: one connection per connector per user; its leading
+    #   user_id column also serves list-by-user lookups, so user_id has no separate index
+    # - connector_id: reverse lookups and ON DELETE CASCADE from connectors
+    # - partial index over active connections per user (the hot status filter)
+    # - GIN index on config_data for JSONB containment (@>) filters, PostgreSQL only
+    __table_args__ = (
+        UniqueConstraint("user_id", "connector_id", name="uq_connection_per_user_connector"),
+        Index("ix_connections_connector_id", "connector_id"),
+        Index(
+            "ix_connections_status_active", "user_id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_connections_config_data_gin", "config_data",
+            postgresql_using="gin",
+            postgresql_ops={"config_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     connector_id = Column(Integer, ForeignKey("connectors.id", ondelete="CASCADE"), nullable=False)
-    # JSON used at model level to stay dialect-agnostic; migration upgrades to JSONB when on Postgres
-    config_data = Column(JSON, nullable=True)
+    # JSONB on Postgres (as the migrations create it) so the GIN index applies; JSON elsewhere
+    config_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     status = Column(String(50), default="inactive", nullable=False)  # active, inactive, error
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Loaded with the row itself, so no per-connection token query or token rows are needed
+    has_oauth_token = column_property(
+        exists().where(OAuthToken.connection_id == id).correlate_except(OAuthToken)
+    )
 
     # Relationships
     user = relationship("User", back_populates="connections")
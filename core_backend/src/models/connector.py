@@ -1,6 +1,9 @@
 """Connector model for third-party service definitions."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from functools import cached_property
+from typing import Tuple
+from sqlalchemy import Column, Integer, String, DateTime, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from src.database.connection import Base
@@ -14,21 +17,34 @@ class Connector(Base):
         id: Primary key
         key: Unique identifier for the connector (e.g., 'jira', 'slack')
         name: Display name for the connector
-        config_schema: JSON schema defining required configuration parameters (uses JSONB on Postgres via migration)
+        config_schema: JSON schema defining required configuration parameters (JSONB on Postgres)
         created_at: Timestamp when connector was created
         connections: Relationship to user connections using this connector
     """
     __tablename__ = "connectors"
+    # GIN index for JSONB containment (@>) filters, created by migration 006 on PostgreSQL only
+    __table_args__ = (
+        Index(
+            "ix_connectors_config_schema_gin", "config_schema",
+            postgresql_using="gin",
+            postgresql_ops={"config_schema": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     key = Column(String(100), unique=True, index=True, nullable=False)
     name = Column(String(200), nullable=False)
-    # JSON used at model level to stay dialect-agnostic; migration upgrades to JSONB when on Postgres
-    config_schema = Column(JSON, nullable=True)
+    # JSONB on Postgres (as the migrations create it) so the GIN index applies; JSON elsewhere
+    config_schema = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     connections = relationship("Connection", back_populates="connector", cascade="all, delete-orphan")
 
+    @cached_property
+    def required_config_fields(self) -> Tuple[str, ...]:
+        """Required configuration keys declared by config_schema, computed once per instance."""
+        return tuple((self.config_schema or {}).get("required") or ())
+
     def __repr__(self):
         return f"<Connector(id={self.id}, key='{self.key}', name='{self.name}')>"
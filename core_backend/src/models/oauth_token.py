@@ -1,5 +1,5 @@
 """OAuth token model for storing authentication tokens."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from src.database.connection import Base
@@ -11,13 +11,24 @@ class OAuthToken(Base):
 
     Attributes:
         id: Primary key
-        connection_id: Foreign key to connections table
+        connection_id: Foreign key to connections table (unique, one token per connection)
         access_token: OAuth access token
         refresh_token: OAuth refresh token (optional)
         expires_at: Token expiration timestamp
         connection: Relationship to the connection this token belongs to
     """
     __tablename__ = "oauth_tokens"
+    __table_args__ = (
+        # One token per connection; the unique index is the conflict target for token upserts
+        # and also serves connection_id lookups and joins
+        Index("uq_oauth_tokens_connection_id", "connection_id", unique=True),
+        # Range scans for tokens nearing expiry; tokens that never expire are left out
+        Index(
+            "ix_oauth_tokens_expires_at", "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL"),
+            sqlite_where=text("expires_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     connection_id = Column(Integer, ForeignKey("connections.id", ondelete="CASCADE"), nullable=False)
@@ -26,7 +37,8 @@ class OAuthToken(Base):
     expires_at = Column(DateTime, nullable=True)
 
     # Relationships
-    connection = relationship("Connection", back_populates="oauth_tokens")
+    # Many-to-one on a NOT NULL FK: an inner join loads the single parent row with the token
+    connection = relationship("Connection", back_populates="oauth_tokens", lazy="joined", innerjoin=True)
 
     def __repr__(self):
         return f"<OAuthToken(id={self.id}, connection_id={self.connection_id}, expires_at={self.expires_at})>"
@@ -1,11 +1,32 @@
 """User model for authentication and user management."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from typing import Optional
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import relationship
 
 from src.database.connection import Base
 
 
+# PUBLIC_INTERFACE
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """
+    Normalize an email address for storage and lookup.
+
+    Args:
+        email: Email address as received
+
+    Returns:
+        Optional[str]: Lower-cased email, or the input unchanged if empty
+    """
+    return email.lower() if email else email
+
+
+def _without_citext(ddl, target, bind, **kw) -> bool:
+    """DDL condition: only databases other than PostgreSQL need the lower(email) index."""
+    return kw["dialect"].name != "postgresql"
+
+
 class User(Base):
     """
     User model for storing user information.
@@ -19,13 +40,21 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
-    # Max length aligned with RFC constraints but left flexible by DB
-    email = Column(String(320), unique=True, index=True, nullable=False)
+    # Max length aligned with RFC constraints but left flexible by DB;
+    # CITEXT on Postgres so the unique index also serves case-insensitive lookups
+    email = Column(String(320).with_variant(CITEXT(), "postgresql"), unique=True, index=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Emails are stored lower-cased; without CITEXT, this functional index keeps lookups on
+    # lower(email) index-backed and rejects case-only duplicates (created by migration 004)
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True).ddl_if(callable_=_without_citext),
+    )
+
     # Relationships
-    # Note: cascade delete aligns with FK ondelete CASCADE configured in migration
-    connections = relationship("Connection", back_populates="user", cascade="all, delete-orphan")
+    # Note: cascade delete aligns with FK ondelete CASCADE configured in migration.
+    # selectin: loading N users fetches all their connections in one extra IN query, not N queries
+    connections = relationship("Connection", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}')>"
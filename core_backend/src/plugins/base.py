@@ -1,21 +1,64 @@
 """Base plugin class for connector implementations."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+import orjson
+
+from src.config import settings
 
 
 class NotConfigured(Exception):
     """Raised when a plugin is missing required configuration (e.g., client id/secret)."""
 
 
-class PluginMetadata(BaseModel):
-    """Metadata for a connector plugin."""
+class PluginMetadata(NamedTuple):
+    """
+    Metadata for a connector plugin.
+
+    Built from trusted plugin code, never from request data, so it is a plain immutable
+    tuple with named fields rather than a validated pydantic model.
+    """
     key: str
     name: str
-    oauth_scopes: List[str]
+    oauth_scopes: Tuple[str, ...]
     supports_oauth: bool = True
 
 
+class TokenResponse(NamedTuple):
+    """Tokens returned by a provider's code exchange or refresh (immutable, attribute access)."""
+    access_token: str
+    refresh_token: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    token_type: str = "Bearer"
+
+
+# PUBLIC_INTERFACE
+@lru_cache(maxsize=32)
+def authorize_url_prefix(base_url: str, client_id: str, static_query: str) -> str:
+    """
+    Build the constant part of a provider's authorize URL, once per client ID.
+
+    Args:
+        base_url: Provider authorize endpoint
+        client_id: OAuth client ID from settings
+        static_query: Pre-encoded parameters that never change (scope, response_type, ...)
+
+    Returns:
+        str: URL ending in '&', ready for the encoded redirect_uri and state
+    """
+    return f"{base_url}?{urlencode({'client_id': client_id})}&{static_query}&"
+
+
+# Metadata is constant per plugin class, so get_metadata() runs once per class and later
+# instances reuse the same PluginMetadata object
+_metadata_by_class: Dict[type, PluginMetadata] = {}
+# Plugins hold no per-request state, so one shared instance per class is enough (see get_instance)
+_instances_by_class: Dict[type, "ConnectorPlugin"] = {}
+
+
 class ConnectorPlugin(ABC):
     """
     Abstract base class for all connector plugins.
@@ -24,15 +67,57 @@ class ConnectorPlugin(ABC):
     the required methods to provide a consistent interface for the plugin system.
     """
 
+    # Token prefixes used by _oauth_stub_tokens for placeholder code exchanges
+    _ACCESS_PREFIX: Optional[str] = None
+    _REFRESH_PREFIX: Optional[str] = None
+    # Name of the settings field holding the OAuth client ID, and the message reported
+    # (or raised as NotConfigured) while it is empty; None means no configuration is needed
+    _CLIENT_ID_SETTING: Optional[str] = None
+    _NOT_CONFIGURED: Optional[str] = None
+    # Provider authorize endpoint, and the parameters that never change (scope, response_type, ...)
+    # urlencoded once when the plugin class is defined; authorize_url only encodes the rest per call
+    _AUTHORIZE_BASE_URL: Optional[str] = None
+    _STATIC_QUERY: Optional[str] = None
+    # Pre-encoded static sample returned by fetch_sample_bytes, so it is never re-serialized
+    _SAMPLE_JSON: Optional[bytes] = None
+
     def __init__(self):
         """Initialize the connector plugin."""
-        self._metadata = self.get_metadata()
+        metadata = _metadata_by_class.get(type(self))
+        if metadata is None:
+            metadata = _metadata_by_class[type(self)] = self.get_metadata()
+        self._metadata = metadata
+        # Static (supports_oauth, oauth_scopes) pair, precomputed once for response building
+        self.oauth_capabilities: Tuple[bool, Tuple[str, ...]] = (metadata.supports_oauth, metadata.oauth_scopes)
+
+    # PUBLIC_INTERFACE
+    @classmethod
+    def get_instance(cls) -> "ConnectorPlugin":
+        """
+        Get the shared instance of this plugin class, creating it on first use.
+
+        Returns:
+            ConnectorPlugin: The single instance for this class
+        """
+        instance = _instances_by_class.get(cls)
+        if instance is None:
+            instance = _instances_by_class.setdefault(cls, cls())
+        return instance
 
     @property
     def metadata(self) -> PluginMetadata:
         """Get plugin metadata."""
         return self._metadata
 
+    @cached_property
+    def config_schema(self) -> Dict[str, Any]:
+        """
+        Configuration schema, built once per plugin instance.
+
+        The same dict is returned on every access; treat it as read-only.
+        """
+        return self.get_config_schema()
+
     @abstractmethod
     def get_metadata(self) -> PluginMetadata:
         """
@@ -48,27 +133,79 @@ class ConnectorPlugin(ABC):
         """
         Get the configuration schema for this connector.
 
+        Built-in plugins return a module constant built once at import; callers share it
+        and must not mutate it.
+
         Returns:
             Dict: JSON schema defining required configuration parameters
         """
         raise NotImplementedError
 
-    @abstractmethod
+    def is_configured(self) -> Tuple[bool, List[str]]:
+        """
+        Check whether the settings this plugin needs (e.g. OAuth client ID) are present.
+
+        The default checks the settings field named by _CLIENT_ID_SETTING, if any.
+
+        Returns:
+            Tuple[bool, List[str]]: (configured, messages describing what is missing)
+        """
+        if self._CLIENT_ID_SETTING is None or getattr(settings, self._CLIENT_ID_SETTING):
+            return True, []
+        return False, [self._NOT_CONFIGURED]
+
+    def _client_id(self) -> str:
+        """
+        Get the OAuth client ID from the settings field named by _CLIENT_ID_SETTING.
+
+        Returns:
+            str: Configured client ID
+
+        Raises:
+            NotConfigured: If the client ID is empty
+        """
+        client_id = getattr(settings, self._CLIENT_ID_SETTING)
+        if not client_id:
+            raise NotConfigured(self._NOT_CONFIGURED)
+        return client_id
+
+    async def is_configured_async(self) -> Tuple[bool, List[str]]:
+        """
+        Asynchronous variant of is_configured for checks that need I/O.
+
+        Plugins that validate configuration remotely (e.g. against the identity provider)
+        override this; the default delegates to is_configured.
+
+        Returns:
+            Tuple[bool, List[str]]: (configured, messages describing what is missing)
+        """
+        return self.is_configured()
+
     def authorize_url(self, redirect_uri: str, state: str) -> str:
         """
         Generate OAuth authorization URL for this connector.
 
+        The default builds it from _AUTHORIZE_BASE_URL, _STATIC_QUERY and the client ID.
+
         Args:
             redirect_uri: OAuth redirect URI
             state: OAuth state parameter for security
 
         Returns:
             str: Authorization URL to redirect user to
+
+        Raises:
+            NotConfigured: If the OAuth client ID is not set
         """
-        raise NotImplementedError
+        if self._AUTHORIZE_BASE_URL is None:
+            raise NotImplementedError(f"OAuth not implemented for {self.metadata.key}")
+        # Only redirect_uri and state are encoded per call; urlencode keeps a redirect URI with
+        # its own query string intact
+        prefix = authorize_url_prefix(self._AUTHORIZE_BASE_URL, self._client_id(), self._STATIC_QUERY)
+        return prefix + urlencode({"redirect_uri": redirect_uri, "state": state})
 
     @abstractmethod
-    async def handle_oauth_callback(self, code: str, state: str) -> Dict[str, Any]:
+    async def handle_oauth_callback(self, code: str, state: str) -> TokenResponse:
         """
         Handle OAuth callback and exchange code for tokens.
 
@@ -77,10 +214,47 @@ class ConnectorPlugin(ABC):
             state: OAuth state parameter
 
         Returns:
-            Dict: Token data including access_token, refresh_token, expires_at
+            TokenResponse: Tokens including access_token, refresh_token, expires_at
         """
         raise NotImplementedError
 
+    def _oauth_stub_tokens(self, code: str) -> TokenResponse:
+        """
+        Build placeholder tokens for a code exchange from the class token prefixes.
+
+        Shared by the built-in plugins until they exchange codes with their providers;
+        no refresh token is issued when _REFRESH_PREFIX is None.
+
+        Args:
+            code: OAuth authorization code
+
+        Returns:
+            TokenResponse: Tokens derived from the first 10 characters of the code
+        """
+        suffix = code[:10]
+        refresh_prefix = self._REFRESH_PREFIX
+        return TokenResponse(
+            access_token=f"{self._ACCESS_PREFIX}{suffix}",
+            refresh_token=f"{refresh_prefix}{suffix}" if refresh_prefix is not None else None,
+        )
+
+    @property
+    def supports_token_refresh(self) -> bool:
+        """Whether this plugin overrides refresh_tokens."""
+        return type(self).refresh_tokens is not ConnectorPlugin.refresh_tokens
+
+    async def refresh_tokens(self, tokens: Dict[str, Any]) -> Optional[TokenResponse]:
+        """
+        Exchange the refresh token for new tokens (optional implementation).
+
+        Args:
+            tokens: Current token data including refresh_token
+
+        Returns:
+            TokenResponse: New tokens; None if this connector cannot refresh tokens
+        """
+        return None
+
     @abstractmethod
     async def test_connection(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -100,6 +274,8 @@ class ConnectorPlugin(ABC):
         """
         Fetch sample data from the service to verify connection.
 
+        Static samples are shared module constants, like get_config_schema(); do not mutate them.
+
         Args:
             config: Connector configuration data
             tokens: OAuth token data (if applicable)
@@ -109,6 +285,25 @@ class ConnectorPlugin(ABC):
         """
         raise NotImplementedError
 
+    async def fetch_sample_bytes(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Fetch sample data as encoded JSON, ready to be sent as a response body.
+
+        Returns _SAMPLE_JSON when the plugin sets it; otherwise fetch_sample() is
+        encoded with orjson.
+
+        Args:
+            config: Connector configuration data
+            tokens: OAuth token data (if applicable)
+
+        Returns:
+            bytes: JSON-encoded sample data
+        """
+        sample_json = self._SAMPLE_JSON
+        if sample_json is not None:
+            return sample_json
+        return orjson.dumps(await self.fetch_sample(config, tokens))
+
     async def execute_action(self, action: str, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         """
         Execute a connector-specific action (optional implementation).
@@ -1,70 +1,79 @@
 """Datadog connector plugin implementation."""
 from typing import Dict, Any, Optional
-from .base import ConnectorPlugin, PluginMetadata, NotConfigured
-from src.config import settings
+from urllib.parse import urlencode
+
+import orjson
+
+from .base import ConnectorPlugin, PluginMetadata, TokenResponse
+
+
+_OAUTH_SCOPES = ("metrics_read", "logs_read", "dashboards_read")
+_METADATA = PluginMetadata(
+    key="datadog",
+    name="Datadog",
+    oauth_scopes=_OAUTH_SCOPES,
+    supports_oauth=True,
+)
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "site": {
+            "type": "string",
+            "title": "Datadog Site",
+            "description": "Your Datadog site (e.g., datadoghq.com, datadoghq.eu)",
+            "default": "datadoghq.com"
+        },
+        "api_key": {
+            "type": "string",
+            "title": "API Key",
+            "description": "Your Datadog API key"
+        },
+        "app_key": {
+            "type": "string",
+            "title": "Application Key",
+            "description": "Your Datadog application key"
+        }
+    },
+    "required": ["site", "api_key", "app_key"]
+}
+_SAMPLE_DATA = {
+    "dashboards": [
+        {"id": "abc-123-def", "title": "System Overview", "url": "https://..."},
+        {"id": "ghi-456-jkl", "title": "Application Metrics", "url": "https://..."}
+    ],
+    "metrics": [
+        {"name": "system.cpu.user", "type": "gauge"},
+        {"name": "system.mem.used", "type": "gauge"},
+        {"name": "application.requests.count", "type": "count"}
+    ]
+}
 
 
 class DatadogConnector(ConnectorPlugin):
     """Datadog connector plugin for Datadog monitoring integration."""
 
+    _ACCESS_PREFIX = "dd_access_token_"
+    _REFRESH_PREFIX = "dd_refresh_token_"
+    _CLIENT_ID_SETTING = "datadog_client_id"
+    _NOT_CONFIGURED = "Datadog is not configured. Set DATADOG_CLIENT_ID and DATADOG_CLIENT_SECRET."
+    _AUTHORIZE_BASE_URL = "https://app.datadoghq.com/oauth2/v1/authorize"
+    _STATIC_QUERY = urlencode({
+        "scope": " ".join(_OAUTH_SCOPES),
+        "response_type": "code",
+    })
+    _SAMPLE_JSON = orjson.dumps(_SAMPLE_DATA)
+
     def get_metadata(self) -> PluginMetadata:
         """Get Datadog plugin metadata."""
-        return PluginMetadata(
-            key="datadog",
-            name="Datadog",
-            oauth_scopes=["metrics_read", "logs_read", "dashboards_read"],
-            supports_oauth=True,
-        )
+        return _METADATA
 
     def get_config_schema(self) -> Dict[str, Any]:
         """Get Datadog configuration schema."""
-        return {
-            "type": "object",
-            "properties": {
-                "site": {
-                    "type": "string",
-                    "title": "Datadog Site",
-                    "description": "Your Datadog site (e.g., datadoghq.com, datadoghq.eu)",
-                    "default": "datadoghq.com"
-                },
-                "api_key": {
-                    "type": "string",
-                    "title": "API Key",
-                    "description": "Your Datadog API key"
-                },
-                "app_key": {
-                    "type": "string",
-                    "title": "Application Key",
-                    "description": "Your Datadog application key"
-                }
-            },
-            "required": ["site", "api_key", "app_key"]
-        }
-
-    def authorize_url(self, redirect_uri: str, state: str) -> str:
-        """Generate Datadog OAuth authorization URL."""
-        client_id = settings.datadog_client_id
-        if not client_id:
-            raise NotConfigured("Datadog is not configured. Set DATADOG_CLIENT_ID and DATADOG_CLIENT_SECRET.")
-        base_url = "https://app.datadoghq.com/oauth2/v1/authorize"
-        scopes = " ".join(self.metadata.oauth_scopes)
-        return (
-            f"{base_url}?"
-            f"client_id={client_id}&"
-            f"redirect_uri={redirect_uri}&"
-            f"scope={scopes}&"
-            f"state={state}&"
-            f"response_type=code"
-        )
+        return _CONFIG_SCHEMA
 
-    async def handle_oauth_callback(self, code: str, state: str) -> Dict[str, Any]:
+    async def handle_oauth_callback(self, code: str, state: str) -> TokenResponse:
         """Handle Datadog OAuth callback."""
-        return {
-            "access_token": f"dd_access_token_{code[:10]}",
-            "refresh_token": f"dd_refresh_token_{code[:10]}",
-            "expires_at": None,
-            "token_type": "Bearer"
-        }
+        return self._oauth_stub_tokens(code)
 
     async def test_connection(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> bool:
         """Test Datadog connection."""
@@ -76,14 +85,4 @@ class DatadogConnector(ConnectorPlugin):
 
     async def fetch_sample(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Fetch sample Datadog data."""
-        return {
-            "dashboards": [
-                {"id": "abc-123-def", "title": "System Overview", "url": "https://..."},
-                {"id": "ghi-456-jkl", "title": "Application Metrics", "url": "https://..."}
-            ],
-            "metrics": [
-                {"name": "system.cpu.user", "type": "gauge"},
-                {"name": "system.mem.used", "type": "gauge"},
-                {"name": "application.requests.count", "type": "count"}
-            ]
-        }
+        return _SAMPLE_DATA
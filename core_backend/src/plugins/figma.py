@@ -1,59 +1,67 @@
 """Figma connector plugin implementation."""
 from typing import Dict, Any, Optional
-from .base import ConnectorPlugin, PluginMetadata, NotConfigured
-from src.config import settings
+from urllib.parse import urlencode
+
+import orjson
+
+from .base import ConnectorPlugin, PluginMetadata, TokenResponse
+
+
+_OAUTH_SCOPES = ("file_read",)
+_METADATA = PluginMetadata(
+    key="figma",
+    name="Figma",
+    oauth_scopes=_OAUTH_SCOPES,
+    supports_oauth=True,
+)
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "team_id": {
+            "type": "string",
+            "title": "Team ID",
+            "description": "Your Figma team ID (optional)"
+        }
+    },
+    "required": []
+}
+_SAMPLE_DATA = {
+    "teams": [
+        {"id": "123456789", "name": "Design Team"},
+        {"id": "123456790", "name": "Product Team"}
+    ],
+    "recent_files": [
+        {"key": "ABC123", "name": "Mobile App Design", "thumbnail_url": "https://..."},
+        {"key": "DEF456", "name": "Web Dashboard", "thumbnail_url": "https://..."}
+    ]
+}
 
 
 class FigmaConnector(ConnectorPlugin):
     """Figma connector plugin for Figma design integration."""
 
+    _ACCESS_PREFIX = "figd_figma_access_token_"
+    _REFRESH_PREFIX = "figr_figma_refresh_token_"
+    _CLIENT_ID_SETTING = "figma_client_id"
+    _NOT_CONFIGURED = "Figma is not configured. Set FIGMA_CLIENT_ID and FIGMA_CLIENT_SECRET."
+    _AUTHORIZE_BASE_URL = "https://www.figma.com/oauth"
+    _STATIC_QUERY = urlencode({
+        "scope": ",".join(_OAUTH_SCOPES),
+        "response_type": "code",
+    })
+    _SAMPLE_JSON = orjson.dumps(_SAMPLE_DATA)
+
     def get_metadata(self) -> PluginMetadata:
         """Get Figma plugin metadata."""
-        return PluginMetadata(
-            key="figma",
-            name="Figma",
-            oauth_scopes=["file_read"],
-            supports_oauth=True,
-        )
+        return _METADATA
 
     def get_config_schema(self) -> Dict[str, Any]:
         """Get Figma configuration schema."""
-        return {
-            "type": "object",
-            "properties": {
-                "team_id": {
-                    "type": "string",
-                    "title": "Team ID",
-                    "description": "Your Figma team ID (optional)"
-                }
-            },
-            "required": []
-        }
-
-    def authorize_url(self, redirect_uri: str, state: str) -> str:
-        """Generate Figma OAuth authorization URL."""
-        client_id = settings.figma_client_id
-        if not client_id:
-            raise NotConfigured("Figma is not configured. Set FIGMA_CLIENT_ID and FIGMA_CLIENT_SECRET.")
-        base_url = "https://www.figma.com/oauth"
-        scopes = ",".join(self.metadata.oauth_scopes)
-        return (
-            f"{base_url}?"
-            f"client_id={client_id}&"
-            f"redirect_uri={redirect_uri}&"
-            f"scope={scopes}&"
-            f"state={state}&"
-            f"response_type=code"
-        )
+        return _CONFIG_SCHEMA
 
-    async def handle_oauth_callback(self, code: str, state: str) -> Dict[str, Any]:
+    async def handle_oauth_callback(self, code: str, state: str) -> TokenResponse:
         """Handle Figma OAuth callback."""
-        return {
-            "access_token": f"figd_figma_access_token_{code[:10]}",
-            "refresh_token": f"figr_figma_refresh_token_{code[:10]}",
-            "expires_at": None,
-            "token_type": "Bearer"
-        }
+        return self._oauth_stub_tokens(code)
 
     async def test_connection(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> bool:
         """Test Figma connection."""
@@ -63,13 +71,4 @@ class FigmaConnector(ConnectorPlugin):
 
     async def fetch_sample(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Fetch sample Figma data."""
-        return {
-            "teams": [
-                {"id": "123456789", "name": "Design Team"},
-                {"id": "123456790", "name": "Product Team"}
-            ],
-            "recent_files": [
-                {"key": "ABC123", "name": "Mobile App Design", "thumbnail_url": "https://..."},
-                {"key": "DEF456", "name": "Web Dashboard", "thumbnail_url": "https://..."}
-            ]
-        }
+        return _SAMPLE_DATA
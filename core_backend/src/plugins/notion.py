@@ -1,58 +1,66 @@
 """Notion connector plugin implementation."""
 from typing import Dict, Any, Optional
-from .base import ConnectorPlugin, PluginMetadata, NotConfigured
-from src.config import settings
+from urllib.parse import urlencode
+
+import orjson
+
+from .base import ConnectorPlugin, PluginMetadata, TokenResponse
+
+
+_OAUTH_SCOPES = ("read", "write")
+_METADATA = PluginMetadata(
+    key="notion",
+    name="Notion",
+    oauth_scopes=_OAUTH_SCOPES,
+    supports_oauth=True,
+)
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "workspace_name": {
+            "type": "string",
+            "title": "Workspace Name",
+            "description": "Your Notion workspace name"
+        }
+    },
+    "required": ["workspace_name"]
+}
+_SAMPLE_DATA = {
+    "databases": [
+        {"id": "12345678-1234-1234-1234-123456789012", "title": "Tasks", "object": "database"},
+        {"id": "12345678-1234-1234-1234-123456789013", "title": "Notes", "object": "database"}
+    ],
+    "pages": [
+        {"id": "12345678-1234-1234-1234-123456789014", "title": "Sample Page", "object": "page"},
+        {"id": "12345678-1234-1234-1234-123456789015", "title": "Another Page", "object": "page"}
+    ]
+}
 
 
 class NotionConnector(ConnectorPlugin):
     """Notion connector plugin for Notion workspace integration."""
 
+    _ACCESS_PREFIX = "secret_notion_access_token_"
+    _CLIENT_ID_SETTING = "notion_client_id"
+    _NOT_CONFIGURED = "Notion is not configured. Set NOTION_CLIENT_ID and NOTION_CLIENT_SECRET."
+    _AUTHORIZE_BASE_URL = "https://api.notion.com/v1/oauth/authorize"
+    _STATIC_QUERY = urlencode({
+        "response_type": "code",
+        "owner": "user",
+    })
+    _SAMPLE_JSON = orjson.dumps(_SAMPLE_DATA)
+
     def get_metadata(self) -> PluginMetadata:
         """Get Notion plugin metadata."""
-        return PluginMetadata(
-            key="notion",
-            name="Notion",
-            oauth_scopes=["read", "write"],
-            supports_oauth=True,
-        )
+        return _METADATA
 
     def get_config_schema(self) -> Dict[str, Any]:
         """Get Notion configuration schema."""
-        return {
-            "type": "object",
-            "properties": {
-                "workspace_name": {
-                    "type": "string",
-                    "title": "Workspace Name",
-                    "description": "Your Notion workspace name"
-                }
-            },
-            "required": ["workspace_name"]
-        }
-
-    def authorize_url(self, redirect_uri: str, state: str) -> str:
-        """Generate Notion OAuth authorization URL."""
-        client_id = settings.notion_client_id
-        if not client_id:
-            raise NotConfigured("Notion is not configured. Set NOTION_CLIENT_ID and NOTION_CLIENT_SECRET.")
-        base_url = "https://api.notion.com/v1/oauth/authorize"
-        return (
-            f"{base_url}?"
-            f"client_id={client_id}&"
-            f"redirect_uri={redirect_uri}&"
-            f"response_type=code&"
-            f"owner=user&"
-            f"state={state}"
-        )
+        return _CONFIG_SCHEMA
 
-    async def handle_oauth_callback(self, code: str, state: str) -> Dict[str, Any]:
+    async def handle_oauth_callback(self, code: str, state: str) -> TokenResponse:
         """Handle Notion OAuth callback."""
-        return {
-            "access_token": f"secret_notion_access_token_{code[:10]}",
-            "refresh_token": None,
-            "expires_at": None,
-            "token_type": "Bearer"
-        }
+        return self._oauth_stub_tokens(code)
 
     async def test_connection(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> bool:
         """Test Notion connection."""
@@ -63,13 +71,4 @@ class NotionConnector(ConnectorPlugin):
 
     async def fetch_sample(self, config: Dict[str, Any], tokens: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Fetch sample Notion data."""
-        return {
-            "databases": [
-                {"id": "12345678-1234-1234-1234-123456789012", "title": "Tasks", "object": "database"},
-                {"id": "12345678-1234-1234-1234-123456789013", "title": "Notes", "object": "database"}
-            ],
-            "pages": [
-                {"id": "12345678-1234-1234-1234-123456789014", "title": "Sample Page", "object": "page"},
-                {"id": "12345678-1234-1234-1234-123456789015", "title": "Another Page", "object": "page"}
-            ]
-        }
+        return _SAMPLE_DATA
@@ -0,0 +1,95 @@
+"""Repository helpers for querying stored OAuth tokens."""
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.database.connection import upsert_insert
+from src.models.oauth_token import OAuthToken
+from src.plugins.base import TokenResponse
+
+
+class OAuthTokenRepository:
+    """
+    Query helpers for OAuth tokens.
+
+    Each connection has at most one token (uq_oauth_tokens_connection_id), so tokens are
+    read and written by connection ID.
+    """
+
+    # PUBLIC_INTERFACE
+    def token_data(self, db: Session, connection_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Read a connection's stored token as the token data passed to plugins.
+
+        Selects the three token columns only, so no ORM instance (or its eagerly joined
+        connection) is built; uq_oauth_tokens_connection_id guarantees at most one row.
+
+        Args:
+            db: Database session
+            connection_id: Connection ID to look up
+
+        Returns:
+            Optional[Dict[str, Any]]: access_token, refresh_token and expires_at, or None
+            if the connection has no token
+        """
+        row = db.execute(
+            select(OAuthToken.access_token, OAuthToken.refresh_token, OAuthToken.expires_at)
+            .where(OAuthToken.connection_id == connection_id)
+        ).first()
+        return row._asdict() if row is not None else None
+
+    # PUBLIC_INTERFACE
+    def update_existing(self, db: Session, connection_id: int, tokens: TokenResponse) -> bool:
+        """
+        Replace a connection's stored token only if it still has one.
+
+        Used for refreshed tokens: a token deleted meanwhile (e.g. revoked) stays deleted.
+        Does not commit; the caller owns the transaction.
+
+        Args:
+            db: Database session
+            connection_id: Connection the token belongs to
+            tokens: Refreshed tokens returned by the connector plugin
+
+        Returns:
+            bool: True if a stored token was updated, False if the connection has none
+        """
+        result = db.execute(
+            update(OAuthToken)
+            .where(OAuthToken.connection_id == connection_id)
+            .values(
+                access_token=tokens.access_token,
+                refresh_token=tokens.refresh_token,
+                expires_at=tokens.expires_at,
+            )
+        )
+        return result.rowcount > 0
+
+    # PUBLIC_INTERFACE
+    def upsert(self, db: Session, connection_id: int, tokens: TokenResponse) -> None:
+        """
+        Store a connection's token, replacing any token it already has.
+
+        Does not commit; the caller owns the transaction.
+
+        Args:
+            db: Database session
+            connection_id: Connection the token belongs to
+            tokens: Tokens returned by the connector plugin
+        """
+        token_values = {
+            "access_token": tokens.access_token,
+            "refresh_token": tokens.refresh_token,
+            "expires_at": tokens.expires_at,
+        }
+        # uq_oauth_tokens_connection_id is the conflict target, so the row is replaced in place
+        db.execute(
+            upsert_insert(db, OAuthToken)
+            .values(connection_id=connection_id, **token_values)
+            .on_conflict_do_update(index_elements=["connection_id"], set_=token_values)
+        )
+
+
+# Global OAuth token repository instance
+oauth_token_repo = OAuthTokenRepository()
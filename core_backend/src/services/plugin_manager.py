@@ -1,13 +1,10 @@
 """Plugin manager service for registering and managing connector plugins."""
-from typing import Dict, List, Optional, Any
-from src.plugins.base import ConnectorPlugin, NotConfigured
-from src.plugins.jira import JiraConnector
-from src.plugins.confluence import ConfluenceConnector
-from src.plugins.slack import SlackConnector
-from src.plugins.notion import NotionConnector
-from src.plugins.figma import FigmaConnector
-from src.plugins.datadog import DatadogConnector
-
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Any, Tuple
+from src.plugins.base import ConnectorPlugin
+from src.services.token_cache import TokenCache, TokenData, token_cache
 
 class PluginManager:
     """
@@ -17,20 +14,63 @@ class PluginManager:
     and provides methods to retrieve them by key.
     """
 
-    def __init__(self):
-        """Initialize the plugin manager with available plugins."""
+    __slots__ = (
+        "_plugins",
+        "_plugins_tuple",
+        "_keys_tuple",
+        "_oauth_plugins",
+        "_non_oauth_plugins",
+        "_availability",
+        "_token_cache",
+        "get_plugin",
+        "is_plugin_available",
+    )
+
+    def __init__(self, tokens: Optional[TokenCache] = None):
+        """
+        Initialize the plugin manager with available plugins.
+
+        Args:
+            tokens: Token cache used by get_tokens; defaults to the global token cache
+        """
+        self._token_cache: TokenCache = tokens if tokens is not None else token_cache
         self._plugins: Dict[str, ConnectorPlugin] = {}
+        # The two per-request lookups are the registry dict's own C methods, bound once so a
+        # call is a plain dict lookup with no Python frame; register_plugin mutates the same
+        # dict in place, so these stay current
+        # PUBLIC_INTERFACE: get_plugin(key) -> Optional[ConnectorPlugin], None if not found
+        self.get_plugin: Callable[[str], Optional[ConnectorPlugin]] = self._plugins.get
+        # PUBLIC_INTERFACE: is_plugin_available(key) -> bool
+        self.is_plugin_available: Callable[[str], bool] = self._plugins.__contains__
+        # Immutable snapshots returned by get_all_plugins/get_plugin_keys, rebuilt on registration
+        self._plugins_tuple: Tuple[ConnectorPlugin, ...] = ()
+        self._keys_tuple: Tuple[str, ...] = ()
+        # Registered plugins split by metadata.supports_oauth, rebuilt on registration
+        self._oauth_plugins: Tuple[ConnectorPlugin, ...] = ()
+        self._non_oauth_plugins: Tuple[ConnectorPlugin, ...] = ()
+        # Availability depends only on the registered plugins and the frozen settings, so it is
+        # built on first request and dropped only when a plugin is registered; it is shared
+        # between callers, so it is built from read-only mappings and tuples
+        self._availability: Optional[Tuple[Mapping[str, Any], ...]] = None
         self._register_builtin_plugins()
 
     def _register_builtin_plugins(self) -> None:
-        """Register all built-in connector plugins."""
+        """Register all built-in connector plugins (their shared instances)."""
+        # Imported here so plugin modules load only once a manager is actually built
+        from src.plugins.jira import JiraConnector
+        from src.plugins.confluence import ConfluenceConnector
+        from src.plugins.slack import SlackConnector
+        from src.plugins.notion import NotionConnector
+        from src.plugins.figma import FigmaConnector
+        from src.plugins.datadog import DatadogConnector
+
         builtin_plugins = [
-            JiraConnector(),
-            ConfluenceConnector(),
-            SlackConnector(),
-            NotionConnector(),
-            FigmaConnector(),
-            DatadogConnector(),
+            JiraConnector.get_instance(),
+            ConfluenceConnector.get_instance(),
+            SlackConnector.get_instance(),
+            NotionConnector.get_instance(),
+            FigmaConnector.get_instance(),
+            DatadogConnector.get_instance(),
         ]
         for plugin in builtin_plugins:
             self.register_plugin(plugin)
@@ -44,87 +84,135 @@ class PluginManager:
         """
         key = plugin.metadata.key
         self._plugins[key] = plugin
+        self._plugins_tuple = tuple(self._plugins.values())
+        self._keys_tuple = tuple(self._plugins)
+        self._oauth_plugins = tuple(p for p in self._plugins_tuple if p.metadata.supports_oauth)
+        self._non_oauth_plugins = tuple(p for p in self._plugins_tuple if not p.metadata.supports_oauth)
+        self._availability = None
 
     # PUBLIC_INTERFACE
-    def get_all_plugins(self) -> List[ConnectorPlugin]:
+    def get_all_plugins(self) -> Tuple[ConnectorPlugin, ...]:
         """
         Get all registered connector plugins.
 
         Returns:
-            List[ConnectorPlugin]: List of all registered plugins
+            Tuple[ConnectorPlugin, ...]: All registered plugins (shared immutable snapshot)
         """
-        return list(self._plugins.values())
+        return self._plugins_tuple
 
     # PUBLIC_INTERFACE
-    def get_plugin(self, key: str) -> Optional[ConnectorPlugin]:
+    def get_plugins_bulk(self, keys: Iterable[str]) -> Dict[str, Optional[ConnectorPlugin]]:
         """
-        Get a specific connector plugin by its key.
+        Resolve several connector plugins by key in a single pass.
 
         Args:
-            key: Plugin key identifier
+            keys: Plugin key identifiers (duplicates are collapsed)
 
         Returns:
-            ConnectorPlugin: The requested plugin, or None if not found
+            Dict[str, Optional[ConnectorPlugin]]: Mapping of each key to its plugin, or None if not found
         """
-        return self._plugins.get(key)
+        plugins = self._plugins
+        return {key: plugins.get(key) for key in keys}
 
     # PUBLIC_INTERFACE
-    def get_plugin_keys(self) -> List[str]:
+    def get_plugin_keys(self) -> Tuple[str, ...]:
         """
         Get all registered plugin keys.
 
         Returns:
-            List[str]: List of all plugin keys
+            Tuple[str, ...]: All plugin keys (shared immutable snapshot)
         """
-        return list(self._plugins.keys())
+        return self._keys_tuple
 
     # PUBLIC_INTERFACE
-    def is_plugin_available(self, key: str) -> bool:
+    async def get_tokens(
+        self,
+        plugin_key: str,
+        connection_id: int,
+        load: Callable[[], Optional[TokenData]],
+    ) -> Optional[TokenData]:
         """
-        Check if a plugin is available.
+        Get usable OAuth tokens for a connection through the token cache.
+
+        Fresh tokens come from memory, stale ones are refreshed in the background and
+        expired ones are refreshed before being returned (see TokenCache).
 
         Args:
-            key: Plugin key identifier
+            plugin_key: Key of the connection's connector plugin
+            connection_id: Connection the tokens belong to
+            load: Zero-argument callable reading the stored token data on a cache miss (run in a
+                worker thread)
 
         Returns:
-            bool: True if plugin is available, False otherwise
+            Optional[TokenData]: Token data, or None if the plugin is unknown or no tokens are stored
         """
-        return key in self._plugins
+        plugin = self._plugins.get(plugin_key)
+        if plugin is None:
+            return None
+        return await self._token_cache.get(connection_id, plugin, load)
 
     # PUBLIC_INTERFACE
-    def get_plugin_availability(self) -> List[Dict[str, Any]]:
+    async def get_plugin_availability(self) -> Tuple[Mapping[str, Any], ...]:
         """
         Get listing of plugins with availability and configuration requirements.
 
+        The OAuth plugins' configuration checks run concurrently, so checks that do I/O
+        cost the slowest one rather than their sum. The listing is computed once and
+        shared between callers, so it is immutable; use dict(item) to get a copy to
+        modify or serialize. Plugins without OAuth come first, then OAuth plugins, each
+        in registration order.
+
         Returns:
-            List[Dict[str, Any]]: Items include key, name, supports_oauth,
-            configured (bool), and requirements (list of missing/notes).
+            Tuple[Mapping[str, Any], ...]: Read-only items with key, name, supports_oauth,
+            configured (bool), and requirements (tuple of missing/notes).
         """
-        items: List[Dict[str, Any]] = []
-        for key, plugin in self._plugins.items():
-            configured = True
-            missing: List[str] = []
-            if plugin.metadata.supports_oauth:
-                # Try to generate an authorize URL with dummy values to detect missing config
-                try:
-                    plugin.authorize_url("http://localhost/example", "state")
-                except NotConfigured as e:
-                    configured = False
-                    missing.append(str(e))
-                except Exception:
-                    # Ignore other errors during probing
-                    pass
+        if self._availability is not None:
+            return self._availability
+        # Plugins without OAuth need no client configuration
+        items: List[Mapping[str, Any]] = [
+            MappingProxyType({
+                "key": plugin.metadata.key,
+                "name": plugin.metadata.name,
+                "supports_oauth": False,
+                "configured": True,
+                "requirements": (),
+            })
+            for plugin in self._non_oauth_plugins
+        ]
+        oauth_plugins = self._oauth_plugins
+        # gather preserves argument order, so results line up with oauth_plugins
+        results = await asyncio.gather(*(plugin.is_configured_async() for plugin in oauth_plugins))
+        for plugin, (configured, missing) in zip(oauth_plugins, results):
+            metadata = plugin.metadata
             items.append(
-                {
-                    "key": plugin.metadata.key,
-                    "name": plugin.metadata.name,
-                    "supports_oauth": plugin.metadata.supports_oauth,
+                MappingProxyType({
+                    "key": metadata.key,
+                    "name": metadata.name,
+                    "supports_oauth": True,
                     "configured": configured,
-                    "requirements": missing,
-                }
+                    "requirements": tuple(missing),
+                })
             )
-        return items
+        availability = self._availability = tuple(items)
+        return availability
+
+# PUBLIC_INTERFACE
+@lru_cache(maxsize=1)
+def get_plugin_manager() -> PluginManager:
+    """
+    Get the global plugin manager, building it on first use.
+
+    Processes that import this module without touching plugins never instantiate
+    (or import) the connector plugins.
+
+    Returns:
+        PluginManager: The process-wide plugin manager
+    """
+    return PluginManager()
 
 
-# Global plugin manager instance
-plugin_manager = PluginManager()
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module attribute `plugin_manager` lazily (PEP 562)."""
+    if name == "plugin_manager":
+        return get_plugin_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
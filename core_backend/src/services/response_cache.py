@@ -0,0 +1,78 @@
+"""In-process TTL cache for read-heavy API responses."""
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from src.config.settings import settings
+
+# Cache key for the combined plugin + database connector listing
+CONNECTORS_LIST_KEY = "connectors:list"
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for computed API responses.
+
+    Entries are keyed by endpoint and dropped explicitly by the handlers that mutate
+    the underlying rows; the TTL bounds staleness for changes made by other worker
+    processes, which do not share this cache.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh; 0 or less disables caching
+        """
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    # PUBLIC_INTERFACE
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable producing the value
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        if self._ttl <= 0:
+            return factory()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        # Compute outside the lock so slow factories don't serialize other keys
+        value = factory()
+        with self._lock:
+            # Don't store a value computed before a concurrent invalidation
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self._ttl, value)
+        return value
+
+    # PUBLIC_INTERFACE
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop cached entries after the data behind them changed.
+
+        Args:
+            keys: Cache keys to drop
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+# Global response cache instance
+response_cache = ResponseCache(ttl=settings.response_cache_ttl)
@@ -0,0 +1,204 @@
+"""In-process OAuth token cache that refreshes tokens before they expire."""
+import asyncio
+import logging
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from src.config.settings import settings
+from src.database.connection import db_session
+from src.plugins.base import ConnectorPlugin, TokenResponse
+from src.services.oauth_token_repository import oauth_token_repo
+
+logger = logging.getLogger(__name__)
+
+# Token data as passed to plugins: access_token, refresh_token, expires_at (naive UTC)
+TokenData = Dict[str, Any]
+
+# Token states relative to expires_at
+TOKEN_FRESH = "fresh"  # outside the refresh window (or never expires): use as is
+TOKEN_STALE = "stale"  # inside the refresh window but still valid: use, refresh in the background
+TOKEN_EXPIRED = "expired"  # past expires_at: refresh before use
+
+
+# PUBLIC_INTERFACE
+def token_state(tokens: TokenData, now: datetime, refresh_window: timedelta) -> str:
+    """
+    Classify token data as fresh, stale or expired.
+
+    Args:
+        tokens: Token data with an optional expires_at
+        now: Current naive UTC time
+        refresh_window: How long before expiry a token counts as stale
+
+    Returns:
+        str: TOKEN_FRESH, TOKEN_STALE or TOKEN_EXPIRED
+    """
+    expires_at = tokens.get("expires_at")
+    if expires_at is None or expires_at - refresh_window > now:
+        return TOKEN_FRESH
+    if expires_at > now:
+        return TOKEN_STALE
+    return TOKEN_EXPIRED
+
+
+class TokenCache:
+    """
+    Per-process cache of OAuth token data keyed by connection ID.
+
+    Fresh tokens are served from memory; stale tokens are served while a background task
+    refreshes them; expired tokens are refreshed before being returned. A per-connection
+    asyncio.Lock makes concurrent callers share one refresh. Entries are re-read from the
+    database after `ttl` seconds, which bounds staleness for writes made by other workers.
+    Refreshed tokens are only written over a stored token, and a refresh that overlaps an
+    invalidate() does not cache its result, so a revoke racing a refresh stays revoked.
+    Must be used from the event loop; invalidate() is also safe from threadpool handlers.
+    """
+
+    def __init__(self, ttl: float, refresh_window: timedelta):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is trusted before it is reloaded
+            refresh_window: How long before expiry tokens are refreshed
+        """
+        self._ttl = ttl
+        self._refresh_window = refresh_window
+        self._entries: Dict[int, Tuple[float, TokenData]] = {}
+        # Bumped by invalidate(); a refresh stores its result only if no invalidation happened meanwhile
+        self._generation = 0
+        # Weak values: a lock lives only while a refresh holds or waits on it, so the mapping
+        # does not grow with every connection ever seen
+        self._locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # Strong references so running background refreshes are not garbage collected
+        self._background: Set[asyncio.Task] = set()
+
+    # PUBLIC_INTERFACE
+    async def get(
+        self,
+        connection_id: int,
+        plugin: ConnectorPlugin,
+        load: Callable[[], Optional[TokenData]],
+    ) -> Optional[TokenData]:
+        """
+        Return usable token data for a connection, refreshing it if needed.
+
+        Args:
+            connection_id: Connection the tokens belong to
+            plugin: Connector plugin used to refresh the tokens
+            load: Zero-argument callable reading the stored token data on a cache miss; it
+                does blocking database work, so it is run in a worker thread
+
+        Returns:
+            Optional[TokenData]: Token data, or None if the connection has no tokens. Expired
+            tokens are returned unchanged when the plugin cannot refresh them.
+        """
+        tokens = self._cached(connection_id)
+        if tokens is None:
+            tokens = await asyncio.to_thread(load)
+            if tokens is None:
+                return None
+            self._store(connection_id, tokens)
+
+        state = token_state(tokens, datetime.utcnow(), self._refresh_window)
+        if state == TOKEN_FRESH:
+            return tokens
+        if state == TOKEN_STALE:
+            # Still valid: answer now and refresh off the request path, unless already running
+            lock = self._locks.get(connection_id)
+            if lock is None or not lock.locked():
+                task = asyncio.create_task(self._refresh_in_background(connection_id, plugin, tokens))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return tokens
+        return await self._refresh(connection_id, plugin, tokens)
+
+    # PUBLIC_INTERFACE
+    def invalidate(self, connection_id: int) -> None:
+        """
+        Drop the cached tokens of a connection after they were stored, replaced or revoked.
+
+        Args:
+            connection_id: Connection whose tokens changed
+        """
+        self._generation += 1
+        self._entries.pop(connection_id, None)
+
+    # PUBLIC_INTERFACE
+    async def refresh(self, connection_id: int, plugin: ConnectorPlugin, tokens: TokenData) -> TokenData:
+        """
+        Refresh a connection's tokens unless they are fresh, sharing any refresh already running.
+
+        Args:
+            connection_id: Connection the tokens belong to
+            plugin: Connector plugin used to refresh the tokens
+            tokens: Current token data
+
+        Returns:
+            TokenData: Refreshed token data, or the current tokens if no refresh was needed or possible
+        """
+        return await self._refresh(connection_id, plugin, tokens)
+
+    def _cached(self, connection_id: int) -> Optional[TokenData]:
+        """Return the cached tokens for connection_id unless missing or past the TTL."""
+        entry = self._entries.get(connection_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _store(self, connection_id: int, tokens: TokenData) -> None:
+        """Cache tokens for connection_id for ttl seconds."""
+        if self._ttl > 0:
+            self._entries[connection_id] = (time.monotonic() + self._ttl, tokens)
+
+    def _lock(self, connection_id: int) -> asyncio.Lock:
+        """Get the refresh lock of a connection, creating it on first use."""
+        lock = self._locks.get(connection_id)
+        if lock is None:
+            lock = self._locks[connection_id] = asyncio.Lock()
+        return lock
+
+    async def _refresh(self, connection_id: int, plugin: ConnectorPlugin, tokens: TokenData) -> TokenData:
+        """Refresh and persist tokens under the connection's lock."""
+        async with self._lock(connection_id):
+            # Another caller may have refreshed while this one waited for the lock
+            current = self._cached(connection_id) or tokens
+            if token_state(current, datetime.utcnow(), self._refresh_window) == TOKEN_FRESH:
+                return current
+            if not current.get("refresh_token"):
+                return current
+
+            generation = self._generation
+            refreshed = await plugin.refresh_tokens(current)
+            if refreshed is None:
+                return current
+            # Persisting is blocking database work, so it runs in a worker thread
+            if not await asyncio.to_thread(self._persist, connection_id, refreshed):
+                # The stored token was deleted (revoked) while refreshing; don't bring it back
+                return current
+            tokens = refreshed._asdict()
+            if generation == self._generation:
+                self._store(connection_id, tokens)
+            return tokens
+
+    async def _refresh_in_background(self, connection_id: int, plugin: ConnectorPlugin, tokens: TokenData) -> None:
+        """Background refresh; failures are logged since the stale token is still usable."""
+        try:
+            await self._refresh(connection_id, plugin, tokens)
+        except Exception:
+            logger.exception("Background token refresh failed for connection %s", connection_id)
+
+    @staticmethod
+    def _persist(connection_id: int, tokens: TokenResponse) -> bool:
+        """Store refreshed tokens over the stored ones in their own transaction; False if none are stored."""
+        with db_session() as db:
+            return oauth_token_repo.update_existing(db, connection_id, tokens)
+
+
+# Global token cache instance
+token_cache = TokenCache(
+    ttl=settings.token_cache_ttl,
+    refresh_window=timedelta(seconds=settings.token_refresh_window),
+)
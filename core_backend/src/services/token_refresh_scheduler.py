@@ -0,0 +1,112 @@
+"""Background task that refreshes OAuth tokens before they expire."""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+
+from src.config.settings import settings
+from src.database.connection import db_session
+from src.models.connection import Connection
+from src.models.connector import Connector
+from src.models.oauth_token import OAuthToken
+from src.services.plugin_manager import get_plugin_manager
+from src.services.token_cache import TokenData, token_cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on refresh calls in flight at once across all connectors
+MAX_CONCURRENT_REFRESHES = 10
+
+
+def _expiring_tokens(connector_keys: List[str], window: timedelta) -> Dict[str, List[Tuple[int, TokenData]]]:
+    """
+    Load refreshable tokens expiring within window, grouped by connector key.
+
+    The expires_at range is served by ix_oauth_tokens_expires_at; only the columns the
+    refresh needs are selected, so no ORM objects or relationships are loaded.
+    """
+    now = datetime.utcnow()
+    stmt = (
+        select(
+            Connector.key,
+            OAuthToken.connection_id,
+            OAuthToken.access_token,
+            OAuthToken.refresh_token,
+            OAuthToken.expires_at,
+        )
+        .join(Connection, Connection.id == OAuthToken.connection_id)
+        .join(Connector, Connector.id == Connection.connector_id)
+        .where(
+            OAuthToken.expires_at.between(now, now + window),
+            OAuthToken.refresh_token.isnot(None),
+            Connector.key.in_(connector_keys),
+        )
+    )
+    grouped: Dict[str, List[Tuple[int, TokenData]]] = defaultdict(list)
+    with db_session() as db:
+        for key, connection_id, access_token, refresh_token, expires_at in db.execute(stmt):
+            grouped[key].append((
+                connection_id,
+                {"access_token": access_token, "refresh_token": refresh_token, "expires_at": expires_at},
+            ))
+    return grouped
+
+
+# PUBLIC_INTERFACE
+async def refresh_expiring_tokens(window: timedelta) -> int:
+    """
+    Refresh every stored token that expires within window, MAX_CONCURRENT_REFRESHES at a time.
+
+    Refreshes go through the token cache, so they are shared with any request-path
+    refresh of the same connection and the cache ends up holding the new tokens.
+
+    Args:
+        window: How far ahead of expiry tokens are refreshed
+
+    Returns:
+        int: Number of tokens a refresh was attempted for
+    """
+    plugins = {plugin.metadata.key: plugin for plugin in get_plugin_manager().get_all_plugins() if plugin.supports_token_refresh}
+    if not plugins:
+        return 0
+
+    # The scan is blocking database work, so it runs in a worker thread
+    grouped = await asyncio.to_thread(_expiring_tokens, list(plugins), window)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REFRESHES)
+
+    async def refresh_one(connector_key: str, connection_id: int, tokens: TokenData) -> None:
+        async with semaphore:
+            try:
+                await token_cache.refresh(connection_id, plugins[connector_key], tokens)
+            except Exception:
+                logger.exception("Scheduled token refresh failed for connection %s", connection_id)
+
+    jobs = [
+        refresh_one(connector_key, connection_id, tokens)
+        for connector_key, entries in grouped.items()
+        for connection_id, tokens in entries
+    ]
+    await asyncio.gather(*jobs)
+    return len(jobs)
+
+
+# PUBLIC_INTERFACE
+async def run_token_refresh_scheduler(interval: float) -> None:
+    """
+    Refresh tokens nearing expiry every interval seconds until cancelled.
+
+    Request-path refresh in the token cache remains the fallback for missed ticks.
+
+    Args:
+        interval: Seconds between scans
+    """
+    window = timedelta(seconds=settings.token_refresh_window)
+    while True:
+        try:
+            await refresh_expiring_tokens(window)
+        except Exception:
+            logger.exception("Token refresh scan failed")
+        await asyncio.sleep(interval)
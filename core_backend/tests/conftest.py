@@ -0,0 +1,35 @@
+"""Shared fixtures: the API app on a throwaway SQLite database."""
+import os
+import tempfile
+
+# Settings are read at import, so the test environment is set before anything from src loads
+_DB_DIR = tempfile.mkdtemp(prefix="connector-framework-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+# Every request rebuilds cached responses, so tests see per-request output
+os.environ["RESPONSE_CACHE_TTL"] = "0"
+os.environ["TOKEN_REFRESH_INTERVAL"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.api.main import app  # noqa: E402
+from src.database.connection import Base, engine, SessionLocal  # noqa: E402
+import src.models  # noqa: E402,F401  (registers all tables on Base.metadata)
+
+
+@pytest.fixture
+def db():
+    """Fresh schema for each test; yields a session on it."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """Test client for the API app, backed by the fresh schema."""
+    return TestClient(app)
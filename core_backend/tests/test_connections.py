@@ -0,0 +1,36 @@
+"""Tests for the connections API."""
+import pytest
+
+from src.auth.jwt import jwt_manager
+
+
+@pytest.fixture
+def auth_headers():
+    return {"Authorization": f"Bearer {jwt_manager.create_user_token(1, 'user@example.com')}"}
+
+
+def test_create_connection_stores_config(client, auth_headers):
+    response = client.post(
+        "/api/connections/",
+        json={"connector_key": "jira", "config_data": {"instance_url": "https://x.atlassian.net", "n": 2 ** 63}},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    assert response.json()["config_data"]["n"] == 2 ** 63
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"connector_key":"jira","config_data":{"workspace_name":"w","n":123456789012345678901234567890}}',
+        b'{"connector_key":"jira","config_data":{"nested":[{"n":-123456789012345678901234567890}]}}',
+        b'{"connector_key":"jira","config_data":{"ratio":NaN}}',
+    ],
+)
+def test_create_connection_rejects_unencodable_numbers(client, auth_headers, body):
+    response = client.post(
+        "/api/connections/",
+        content=body,
+        headers={**auth_headers, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
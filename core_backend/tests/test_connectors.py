@@ -0,0 +1,66 @@
+"""Tests for connector responses, their ETags and connector deletion."""
+import asyncio
+
+from src.models import Connection, Connector, OAuthToken, User
+from src.services.plugin_manager import get_plugin_manager
+from src.services.token_cache import token_cache
+
+
+def test_plugin_connector_etag_is_stable_and_revalidates(client):
+    first = client.get("/api/connectors/jira")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = client.get("/api/connectors/jira")
+    assert second.headers["ETag"] == etag
+    assert second.json() == first.json()
+
+    revalidated = client.get("/api/connectors/jira", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_plugin_connector_etag_does_not_depend_on_process_start(client):
+    # Workers started at different times must agree on the body, hence on the ETag
+    assert client.get("/api/connectors/jira").json()["created_at"] == "1970-01-01T00:00:00"
+
+
+def test_connector_list_etag_is_stable_and_revalidates(client):
+    # The response cache is disabled in tests, so each request rebuilds the body
+    first = client.get("/api/connectors/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    assert client.get("/api/connectors/").headers["ETag"] == etag
+    revalidated = client.get("/api/connectors/", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+
+
+def test_delete_connector_drops_cached_tokens_of_its_connections(client, db):
+    user = User(email="owner@example.com")
+    connector = Connector(key="custom", name="Custom")
+    connection = Connection(user=user, connector=connector, status="active")
+    db.add_all([user, connector, connection])
+    db.flush()
+    db.add(OAuthToken(connection_id=connection.id, access_token="cached-token"))
+    db.commit()
+    connection_id = connection.id
+
+    plugin = get_plugin_manager().get_plugin("jira")
+    tokens = {"access_token": "cached-token", "refresh_token": None, "expires_at": None}
+    assert asyncio.run(token_cache.get(connection_id, plugin, lambda: tokens)) == tokens
+
+    assert client.delete("/api/connectors/custom").status_code == 204
+
+    # A cache miss falls through to the loader, which now finds nothing
+    assert asyncio.run(token_cache.get(connection_id, plugin, lambda: None)) is None
+    assert db.query(Connection).filter(Connection.id == connection_id).first() is None
+
+
+def test_connector_list_varies_on_accept(client):
+    assert client.get("/api/connectors/").headers["Vary"] == "Accept"
+    streamed = client.get("/api/connectors/", headers={"Accept": "application/x-ndjson"})
+    assert streamed.headers["Vary"] == "Accept"
+    assert streamed.headers["Content-Type"].startswith("application/x-ndjson")
+    etag = client.get("/api/connectors/").headers["ETag"]
+    assert client.get("/api/connectors/", headers={"If-None-Match": etag}).headers["Vary"] == "Accept"
@@ -0,0 +1,42 @@
+"""Tests for the JSON columns and their indexes."""
+import math
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.models import Connection, Connector, User
+
+
+def test_config_data_round_trips_wide_integers_and_nan(db):
+    config = {"workspace_name": "w", "n": 123456789012345678901234567890, "ratio": float("nan")}
+    connection = Connection(
+        user=User(email="wide@example.com"),
+        connector=Connector(key="wide", name="Wide"),
+        status="inactive",
+        config_data=config,
+    )
+    db.add(connection)
+    db.commit()
+    db.expire_all()
+
+    stored = db.query(Connection).one().config_data
+    assert stored["n"] == 123456789012345678901234567890
+    assert isinstance(stored["n"], int)
+    assert math.isnan(stored["ratio"])
+
+
+@pytest.mark.parametrize(
+    "model, name, column",
+    [
+        (Connector, "ix_connectors_config_schema_gin", "config_schema"),
+        (Connection, "ix_connections_config_data_gin", "config_data"),
+    ],
+)
+def test_gin_indexes_are_declared_for_postgres_only(db, model, name, column):
+    index = next(index for index in model.__table__.indexes if index.name == name)
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert f"USING gin ({column} jsonb_path_ops)" in ddl
+    # The db fixture created the tables on SQLite, which must not get the GIN index
+    assert name not in {index["name"] for index in inspect(db.get_bind()).get_indexes(model.__tablename__)}
@@ -0,0 +1,23 @@
+"""Tests for the base64url helpers shared by the JWT and OAuth state codecs."""
+import base64
+
+import pytest
+
+from src.auth.encoding import b64url_decode, b64url_encode
+
+
+@pytest.mark.parametrize("data", [b"", b"f", b"fo", b"foo", b"\xfb\xff\xfe", bytes(range(256))])
+def test_round_trip_matches_stdlib(data):
+    encoded = b64url_encode(data)
+    assert encoded == base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    assert "=" not in encoded
+    assert b64url_decode(encoded) == data
+
+
+def test_decode_accepts_padding():
+    assert b64url_decode("Zm8=") == b"fo"
+
+
+def test_decode_rejects_bad_length():
+    with pytest.raises(ValueError):
+        b64url_decode("A")
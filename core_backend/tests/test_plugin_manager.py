@@ -0,0 +1,22 @@
+"""Tests for the plugin manager."""
+import asyncio
+
+import pytest
+
+from src.services.plugin_manager import PluginManager
+
+
+def test_plugin_availability_is_shared_and_read_only():
+    manager = PluginManager()
+    availability = asyncio.run(manager.get_plugin_availability())
+
+    assert asyncio.run(manager.get_plugin_availability()) is availability
+    assert isinstance(availability, tuple)
+    item = availability[0]
+    with pytest.raises(TypeError):
+        item["configured"] = True
+    assert isinstance(item["requirements"], tuple)
+    # A copy can still be changed freely
+    copy = dict(item)
+    copy["configured"] = not item["configured"]
+    assert asyncio.run(manager.get_plugin_availability())[0]["configured"] == item["configured"]
@@ -0,0 +1,165 @@
+"""Tests for the OAuth token cache."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import Connection, Connector, OAuthToken, User
+from src.plugins.base import TokenResponse
+from src.services.token_cache import TOKEN_EXPIRED, TOKEN_FRESH, TOKEN_STALE, TokenCache, token_state
+
+WINDOW = timedelta(minutes=3)
+
+
+class StubPlugin:
+    """Plugin stand-in that counts refresh_tokens calls and can run a hook mid-refresh."""
+
+    def __init__(self, during_refresh=None):
+        self.refresh_calls = 0
+        self.during_refresh = during_refresh
+
+    async def refresh_tokens(self, tokens):
+        self.refresh_calls += 1
+        await asyncio.sleep(0.01)
+        if self.during_refresh is not None:
+            await asyncio.to_thread(self.during_refresh)
+        return TokenResponse(
+            access_token=f"refreshed-{self.refresh_calls}",
+            refresh_token="refresh",
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+        )
+
+
+@pytest.fixture
+def connection_id(db):
+    """A stored connection with an expired token."""
+    connection = Connection(
+        user=User(email="tokens@example.com"),
+        connector=Connector(key="tokens", name="Tokens"),
+        status="active",
+    )
+    db.add(connection)
+    db.flush()
+    db.add(OAuthToken(
+        connection_id=connection.id,
+        access_token="old",
+        refresh_token="refresh",
+        expires_at=datetime.utcnow() - timedelta(minutes=1),
+    ))
+    db.commit()
+    return connection.id
+
+
+def _tokens(expires_in):
+    expires_at = None if expires_in is None else datetime.utcnow() + expires_in
+    return {"access_token": "old", "refresh_token": "refresh", "expires_at": expires_at}
+
+
+def _expired():
+    return _tokens(timedelta(minutes=-1))
+
+
+@pytest.mark.parametrize(
+    "expires_in, state",
+    [
+        (None, TOKEN_FRESH),
+        (timedelta(hours=1), TOKEN_FRESH),
+        (timedelta(minutes=1), TOKEN_STALE),
+        (timedelta(minutes=-1), TOKEN_EXPIRED),
+    ],
+)
+def test_token_state(expires_in, state):
+    assert token_state(_tokens(expires_in), datetime.utcnow(), WINDOW) == state
+
+
+def test_fresh_tokens_are_served_from_memory():
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    plugin = StubPlugin()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return _tokens(timedelta(hours=1))
+
+    async def scenario():
+        first = await cache.get(1, plugin, load)
+        second = await cache.get(1, plugin, load)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+    assert len(loads) == 1
+    assert plugin.refresh_calls == 0
+
+
+def test_stale_tokens_are_returned_and_refreshed_in_background(connection_id):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    plugin = StubPlugin()
+
+    async def scenario():
+        served = await cache.get(connection_id, plugin, lambda: _tokens(timedelta(minutes=1)))
+        await asyncio.gather(*cache._background)
+        return served, await cache.get(connection_id, plugin, lambda: None)
+
+    served, after = asyncio.run(scenario())
+    assert served["access_token"] == "old"
+    assert after["access_token"] == "refreshed-1"
+    assert plugin.refresh_calls == 1
+
+
+def test_expired_tokens_are_refreshed_before_use(connection_id, db):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    plugin = StubPlugin()
+
+    tokens = asyncio.run(cache.get(connection_id, plugin, _expired))
+
+    assert tokens["access_token"] == "refreshed-1"
+    assert plugin.refresh_calls == 1
+    stored = db.query(OAuthToken).filter(OAuthToken.connection_id == connection_id).one()
+    db.refresh(stored)
+    assert stored.access_token == "refreshed-1"
+
+
+def test_concurrent_callers_share_one_refresh(connection_id):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    plugin = StubPlugin()
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get(connection_id, plugin, _expired) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert plugin.refresh_calls == 1
+    assert {tokens["access_token"] for tokens in results} == {"refreshed-1"}
+
+
+def test_refresh_locks_are_released(connection_id):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    asyncio.run(cache.get(connection_id, StubPlugin(), _expired))
+    assert len(cache._locks) == 0
+
+
+def test_refresh_does_not_restore_tokens_revoked_meanwhile(db, connection_id):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+
+    def revoke():
+        db.query(OAuthToken).filter(OAuthToken.connection_id == connection_id).delete()
+        db.commit()
+        cache.invalidate(connection_id)
+
+    plugin = StubPlugin(during_refresh=revoke)
+    asyncio.run(cache.get(connection_id, plugin, _expired))
+
+    assert plugin.refresh_calls == 1
+    assert db.query(OAuthToken).filter(OAuthToken.connection_id == connection_id).count() == 0
+    # Nothing was cached: the next read goes to the loader
+    assert asyncio.run(cache.get(connection_id, plugin, lambda: None)) is None
+
+
+def test_refresh_overlapping_invalidate_is_not_cached(db, connection_id):
+    cache = TokenCache(ttl=60, refresh_window=WINDOW)
+    plugin = StubPlugin(during_refresh=lambda: cache.invalidate(connection_id))
+
+    tokens = asyncio.run(cache.get(connection_id, plugin, _expired))
+
+    assert tokens["access_token"] == "refreshed-1"
+    assert asyncio.run(cache.get(connection_id, plugin, lambda: None)) is None